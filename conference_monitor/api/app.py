@@ -2,18 +2,25 @@
 Conference Monitor API
 Flask-based API for the Conference Monitor application
 """
-from flask import Flask, request, jsonify
+from flask import Flask, Response, g, request, jsonify, stream_with_context
 from flask_cors import CORS
+from flask.json.provider import JSONProvider
+from flask_caching import Cache
+from flask_compress import Compress
+import orjson
 import os
 import logging
-from dotenv import load_dotenv
-import json
-from pathlib import Path
+import functools
 from datetime import datetime
 import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict
 
-# Load environment variables
-load_dotenv()
+# Importing config also loads environment variables from .env
+from conference_monitor.config import API_CACHE_TIMEOUT_SECONDS, API_MAX_PAGE_SIZE
 
 # Configure logging
 logging.basicConfig(
@@ -22,9 +29,35 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider that encodes and decodes with orjson"""
+    
+    def dumps(self, obj, **kwargs) -> str:
+        """Serialize an object to a JSON string"""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    
+    def loads(self, s, **kwargs):
+        """Deserialize a JSON string or bytes"""
+        return orjson.loads(s)
+
 # Initialize Flask app
 app = Flask(__name__)
-CORS(app)  # Enable CORS for all routes
+app.json = OrjsonProvider(app)
+CORS(app, expose_headers=['X-Total-Count'])  # Enable CORS for all routes
+
+# Responses only change when data is refreshed, so cache them in-process
+cache = Cache(app, config={
+    "CACHE_TYPE": "SimpleCache",
+    "CACHE_DEFAULT_TIMEOUT": API_CACHE_TIMEOUT_SECONDS
+})
+
+# Compress JSON responses larger than 1 KB, preferring brotli over gzip
+app.config.update(
+    COMPRESS_MIN_SIZE=1024,
+    COMPRESS_ALGORITHM=['br', 'gzip'],
+    COMPRESS_MIMETYPES=['application/json']
+)
+Compress(app)
 
 # Import core functionality
 from conference_monitor.core.agent import ConferenceAgent
@@ -32,217 +65,379 @@ from conference_monitor.core.memory import AgentMemory
 from conference_monitor.core.browser import BrowserManager
 from conference_monitor.services.monitor_service import MonitorService
 
-# Initialize services
-agent = ConferenceAgent()
-memory = AgentMemory()
-browser = BrowserManager()
-monitor_service = MonitorService(agent=agent, memory=memory, browser=browser)
+# Services are created on first use so importing the app stays cheap
+@functools.lru_cache(maxsize=1)
+def get_agent() -> ConferenceAgent:
+    """Get the shared conference agent"""
+    return ConferenceAgent()
 
-# Ensure data directories exist
-data_dir = Path("data")
-(data_dir / "papers").mkdir(parents=True, exist_ok=True)
-(data_dir / "conferences").mkdir(parents=True, exist_ok=True)
-(data_dir / "reports").mkdir(parents=True, exist_ok=True)
+@functools.lru_cache(maxsize=1)
+def get_memory() -> AgentMemory:
+    """Get the shared agent memory"""
+    return AgentMemory()
 
-# API Routes
+@functools.lru_cache(maxsize=1)
+def get_browser() -> BrowserManager:
+    """Get the shared browser manager"""
+    return BrowserManager()
 
-@app.route('/api/status', methods=['GET'])
-def get_status():
-    """Get API status"""
+@functools.lru_cache(maxsize=1)
+def get_monitor_service() -> MonitorService:
+    """Get the shared monitor service"""
+    return MonitorService(agent=get_agent(), memory=get_memory(), browser=get_browser())
+
+# Long-running refreshes run in the background and are polled by job id
+executor = ThreadPoolExecutor(max_workers=2)
+jobs: Dict[str, Future] = {}
+jobs_lock = threading.Lock()  # Request threads submit and prune jobs concurrently
+MAX_TRACKED_JOBS = 100
+
+def get_db() -> sqlite3.Connection:
+    """Get the database connection for the current request, opening it on first use
+    
+    Returns:
+        SQLite connection with sqlite3.Row rows
+    """
+    if 'db' not in g:
+        g.db = get_memory().connect()
+        g.db.row_factory = sqlite3.Row
+    return g.db
+
+@app.teardown_appcontext
+def close_db(exception=None):
+    """Close the request's database connection, if one was opened"""
+    conn = g.pop('db', None)
+    if conn is not None:
+        conn.close()
+
+def fts_phrase(term: str) -> str:
+    """Quote a search term as an FTS5 phrase query
+    
+    Args:
+        term: Raw search term
+        
+    Returns:
+        FTS5 query matching the term as a phrase
+    """
+    return '"' + term.replace('"', '""') + '"'
+
+def is_cacheable(response) -> bool:
+    """Check whether a view result should be stored in the cache
+    
+    Args:
+        response: Value returned by the view
+        
+    Returns:
+        True for successful responses, False for errors
+    """
+    if isinstance(response, tuple):
+        return len(response) < 2 or response[1] == 200
+    if getattr(response, 'is_streamed', False):
+        return False
+    return getattr(response, 'status_code', 200) == 200
+
+def stream_json_array(items):
+    """Yield a JSON array piece by piece from already-encoded items
+    
+    Args:
+        items: Iterable of JSON-encoded strings
+        
+    Yields:
+        Chunks of the JSON array
+    """
+    yield '['
+    first = True
+    for item in items:
+        if not first:
+            yield ','
+        yield item
+        first = False
+    yield ']'
+
+def submit_job(func: Callable[..., Dict[str, Any]], *args) -> str:
+    """Run a function in the background executor
+    
+    Args:
+        func: Function returning a JSON-serializable result
+        *args: Arguments for the function
+        
+    Returns:
+        ID of the submitted job
+    """
+    job_id = uuid.uuid4().hex
+    
+    with jobs_lock:
+        # Forget the oldest finished jobs once too many are tracked
+        for old_id in [old_id for old_id, future in jobs.items() if future.done()]:
+            if len(jobs) < MAX_TRACKED_JOBS:
+                break
+            del jobs[old_id]
+        
+        jobs[job_id] = executor.submit(func, *args)
+    return job_id
+
+def accepted_job(job_id: str):
+    """Build the 202 response for a submitted job
+    
+    Args:
+        job_id: ID of the submitted job
+        
+    Returns:
+        Response tuple pointing the client at the job status endpoint
+    """
     return jsonify({
+        "success": True,
+        "job_id": job_id,
+        "status_url": f"/api/jobs/{job_id}"
+    }), 202
+
+@app.after_request
+def add_etag(response):
+    """Tag successful GET responses and answer matching If-None-Match with 304"""
+    if request.method == 'GET' and response.status_code == 200 and not response.is_streamed:
+        response.add_etag()
+        response.make_conditional(request)
+    return response
+
+# API Routes
+
+@functools.lru_cache(maxsize=1)
+def get_status_body() -> bytes:
+    """Get the encoded status payload, which never changes while the process runs"""
+    return orjson.dumps({
         "status": "online",
         "version": "1.0.0",
-        "api_provider": agent.provider
+        "api_provider": get_agent().provider
     })
 
+@app.route('/api/status', methods=['GET'])
+def get_status():
+    """Get API status"""
+    return Response(get_status_body(), mimetype='application/json')
+
 @app.route('/api/conferences', methods=['GET'])
+@cache.cached(timeout=API_CACHE_TIMEOUT_SECONDS, query_string=True, response_filter=is_cacheable)
 def get_conferences():
     """Get all tracked conferences"""
     research_area = request.args.get('area', None)
     tier = request.args.get('tier', None)
+    limit = min(max(request.args.get('limit', API_MAX_PAGE_SIZE, type=int), 0), API_MAX_PAGE_SIZE)
+    offset = max(request.args.get('offset', 0, type=int), 0)
     
     try:
         # Use direct database access for better performance
-        db_path = memory.db_file
+        db_path = get_memory().db_file
         
         if os.path.exists(db_path):
-            conn = sqlite3.connect(db_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
+            cursor = get_db().cursor()
             
             # Get current date
             current_date = datetime.now().isoformat()[:10]  # YYYY-MM-DD format
             
-            query = """
-            SELECT data FROM conferences 
-            WHERE end_date >= ? 
-            """
-            params = [current_date]
+            # The result only changes when conferences are written or the
+            # date rolls over, so answer revalidations before querying
+            cursor.execute("SELECT MAX(updated_at) FROM conferences")
+            etag = f"conferences-{cursor.fetchone()[0]}-{current_date}"
+            if request.if_none_match.contains(etag):
+                response = Response(status=304)
+                response.set_etag(etag)
+                return response
             
-            if research_area:
-                query += "AND (research_areas LIKE ? OR title LIKE ? OR description LIKE ?)"
-                search_term = f"%{research_area.lower()}%"
-                params.extend([search_term, search_term, search_term])
+            where = "end_date >= ? AND (? IS NULL OR tier = ?) AND title_norm != ''"
+            params = [current_date, tier or None, tier or None]
             
-            cursor.execute(query, params)
-            rows = cursor.fetchall()
+            if research_area:
+                # Match the research area as a phrase against the full-text index
+                where += " AND rowid IN (SELECT rowid FROM conferences_fts WHERE conferences_fts MATCH ?)"
+                params.append(fts_phrase(research_area))
             
-            # Process results and deduplicate
-            seen_titles = set()
-            unique_conferences = []
+            cursor.execute(f"SELECT COUNT(DISTINCT title_norm) FROM conferences WHERE {where}", params)
+            total_count = cursor.fetchone()[0]
             
-            for row in rows:
-                conf = json.loads(row['data'])
-                title = conf.get('title', '').strip().lower()
-                
-                if title and title not in seen_titles:
-                    # Apply tier filtering if specified
-                    if tier and conf.get('tier') != tier:
-                        continue
-                        
-                    seen_titles.add(title)
-                    unique_conferences.append(conf)
+            # Deduplicate by normalized title, keeping the first stored row
+            # of each group, and order chronologically in SQL with undated
+            # conferences last
+            cursor.execute(f"""
+            SELECT data, MIN(rowid) FROM conferences
+            WHERE {where}
+            GROUP BY title_norm
+            ORDER BY COALESCE(NULLIF(start_date, ''), '9999-12-31')
+            LIMIT ? OFFSET ?
+            """, params + [limit, offset])
             
-            # Sort conferences by start_date (chronological order)
-            sorted_conferences = sorted(
-                unique_conferences,
-                key=lambda x: x.get('start_date', '9999-12-31')  # Use far future date as default
-            )
+            # The data column already holds JSON, so rows are joined as-is
+            # instead of being decoded and re-encoded
+            body = '[' + ','.join(row['data'] for row in cursor) + ']'
             
-            conn.close()
-            return jsonify(sorted_conferences)
+            response = Response(body, mimetype='application/json')
+            response.set_etag(etag)
+            response.headers['X-Total-Count'] = str(total_count)
+            return response
     except Exception as e:
         logger.error(f"Database query error: {str(e)}")
         # Fall back to file-based approach if database fails
     
     # Fallback to the file-based approach
-    conferences = memory.load_conferences()
-    
-    # Get current date
-    current_date = datetime.now()
+    entries = get_memory().load_conference_search_entries()
     
-    # Filter out invalid conferences (missing required fields)
-    valid_conferences = [
-        conf for conf in conferences 
-        if 'title' in conf and conf['title'] and 'id' in conf
-    ]
+    now_epoch = int(time.time())
+    needle = research_area.lower() if research_area else None
     
-    # Filter only upcoming conferences
+    # Filter only valid, upcoming conferences
     upcoming_conferences = []
     seen_titles = set()  # For deduplication
     
-    for conf in valid_conferences:
-        # Only add conference if its title hasn't been seen yet (deduplication)
-        conf_title = conf.get('title', '').strip().lower()
+    for conf, conf_title, search_text in entries:
+        # Skip invalid conferences (missing required fields)
+        if not conf_title or 'id' not in conf:
+            continue
         
+        # Only add conference if its title hasn't been seen yet (deduplication)
         if conf_title in seen_titles:
             continue
         
         # Apply tier filtering
         if tier and conf.get('tier') != tier:
             continue
-            
-        # Check if conference is upcoming
-        is_upcoming = True
         
-        # Parse end_date if it exists
-        if 'end_date' in conf and conf['end_date']:
-            try:
-                end_date = datetime.fromisoformat(conf['end_date'].replace('Z', '+00:00'))
-                is_upcoming = end_date > current_date
-            except (ValueError, TypeError):
-                # If date parsing fails, try to guess from dates string
-                dates_str = conf.get('dates', '').lower()
-                if dates_str and any(year in dates_str for year in ['2020', '2021', '2022', '2023']):
-                    is_upcoming = False
+        # Apply research area filter if provided
+        if needle and needle not in search_text:
+            continue
         
-        if is_upcoming:
+        # end_epoch is computed when the conference is saved
+        if (conf.get('end_epoch') or 0) > now_epoch:
             upcoming_conferences.append(conf)
             seen_titles.add(conf_title)
     
-    # Sort conferences by start_date (chronological order)
-    sorted_conferences = sorted(
-        upcoming_conferences,
-        key=lambda x: x.get('start_date', '9999-12-31')  # Use far future date as default
-    )
-    
-    # Apply research area filter if provided
-    if research_area:
-        filtered_conferences = [
-            conf for conf in sorted_conferences 
-            if research_area.lower() in conf.get('description', '').lower() or
-               research_area.lower() in conf.get('title', '').lower() or
-               research_area.lower() in ', '.join(conf.get('research_areas', [])).lower()
-        ]
-        return jsonify(filtered_conferences)
-    
-    return jsonify(sorted_conferences)
+    # Entries are already in chronological order
+    response = jsonify(upcoming_conferences[offset:offset + limit])
+    response.headers['X-Total-Count'] = str(len(upcoming_conferences))
+    return response
 
 @app.route('/api/conferences/refresh', methods=['POST'])
 def refresh_conferences():
-    """Refresh conference data"""
+    """Start a conference data refresh in the background"""
     data = request.json or {}
     research_areas = data.get('research_areas', ['artificial intelligence', 'machine learning'])
     
-    try:
-        results = monitor_service.refresh_conferences(research_areas)
-        return jsonify({
-            "success": True,
-            "message": f"Found {results.get('total_conferences', 0)} conferences",
-            "results": results
-        })
-    except Exception as e:
-        logger.error(f"Error refreshing conferences: {str(e)}")
-        return jsonify({
-            "success": False,
-            "message": f"Error: {str(e)}"
-        }), 500
+    return accepted_job(submit_job(refresh_conferences_job, research_areas))
+
+def refresh_conferences_job(research_areas: list) -> Dict[str, Any]:
+    """Refresh conference data and clear cached responses
+    
+    Args:
+        research_areas: Research areas to refresh
+        
+    Returns:
+        Refresh summary
+    """
+    results = get_monitor_service().refresh_conferences(research_areas)
+    with app.app_context():
+        cache.clear()
+    return {
+        "success": True,
+        "message": f"Found {results.get('total_conferences', 0)} conferences",
+        "results": results
+    }
 
 @app.route('/api/papers', methods=['GET'])
 def get_papers():
     """Get all tracked papers"""
     research_area = request.args.get('area', None)
-    papers = memory.load_papers()
+    
+    try:
+        cursor = get_db().cursor()
+        
+        query = "SELECT data FROM papers"
+        params = []
+        
+        if research_area:
+            query += " WHERE rowid IN (SELECT rowid FROM papers_fts WHERE papers_fts MATCH ?)"
+            params.append(fts_phrase(research_area))
+        
+        cursor.execute(query, params)
+        
+        # The data column already holds JSON, so rows are sent as-is
+        return Response(
+            stream_with_context(stream_json_array(row['data'] for row in cursor)),
+            mimetype='application/json'
+        )
+    except Exception as e:
+        logger.error(f"Database query error: {str(e)}")
+        # Fall back to file-based approach if database fails
+    
+    papers = get_memory().load_papers()
     
     if research_area:
         # Filter by research area if provided
-        filtered_papers = [
+        needle = research_area.lower()
+        papers = [
             paper for paper in papers 
-            if research_area.lower() in paper.get('research_area', '').lower() or
-               research_area.lower() in paper.get('title', '').lower()
+            if needle in paper.get('research_area', '').lower() or
+               needle in paper.get('title', '').lower()
         ]
-        return jsonify(filtered_papers)
     
-    return jsonify(papers)
+    return Response(
+        stream_with_context(stream_json_array(app.json.dumps(paper) for paper in papers)),
+        mimetype='application/json'
+    )
 
 @app.route('/api/papers/refresh', methods=['POST'])
 def refresh_papers():
-    """Refresh paper data"""
+    """Start a paper data refresh in the background"""
     data = request.json or {}
     research_areas = data.get('research_areas', ['artificial intelligence', 'machine learning'])
     
-    try:
-        results = monitor_service.refresh_papers(research_areas)
+    return accepted_job(submit_job(refresh_papers_job, research_areas))
+
+def refresh_papers_job(research_areas: list) -> Dict[str, Any]:
+    """Refresh paper data and clear cached responses
+    
+    Args:
+        research_areas: Research areas to refresh
+        
+    Returns:
+        Refresh summary
+    """
+    results = get_monitor_service().refresh_papers(research_areas)
+    with app.app_context():
+        cache.clear()
+    return {
+        "success": True,
+        "message": f"Found {results.get('total_papers', 0)} papers",
+        "results": results
+    }
+
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    """Get the state of a background job"""
+    future = jobs.get(job_id)
+    if future is None:
+        return jsonify({"error": "Unknown job id"}), 404
+    
+    if not future.done():
+        return jsonify({"job_id": job_id, "state": "pending"})
+    
+    error = future.exception()
+    if error is not None:
+        logger.error(f"Error in background job {job_id}: {str(error)}")
         return jsonify({
-            "success": True,
-            "message": f"Found {results.get('total_papers', 0)} papers",
-            "results": results
+            "job_id": job_id,
+            "state": "failed",
+            "message": f"Error: {str(error)}"
         })
-    except Exception as e:
-        logger.error(f"Error refreshing papers: {str(e)}")
-        return jsonify({
-            "success": False,
-            "message": f"Error: {str(e)}"
-        }), 500
+    
+    return jsonify({"job_id": job_id, "state": "done", "result": future.result()})
 
 @app.route('/api/trends', methods=['GET'])
+@cache.cached(timeout=API_CACHE_TIMEOUT_SECONDS, query_string=True, response_filter=is_cacheable)
 def get_trends():
     """Get trending topics"""
     research_area = request.args.get('area', 'artificial intelligence')
     paper_count = int(request.args.get('count', 10))
     
     try:
-        results = monitor_service.analyze_trending_topics([research_area], paper_count=paper_count)
+        results = get_monitor_service().analyze_trending_topics([research_area], paper_count=paper_count)
         return jsonify(results)
     except Exception as e:
         logger.error(f"Error analyzing trends: {str(e)}")
@@ -260,7 +455,7 @@ def run_query():
     
     query = data.get('query')
     try:
-        response = agent.run_query(query)
+        response = get_agent().run_query(query, match_similar=True)
         return jsonify({
             "success": True,
             "response": response
@@ -273,9 +468,10 @@ def run_query():
         }), 500
 
 @app.route('/api/research-areas', methods=['GET'])
+@cache.cached(timeout=API_CACHE_TIMEOUT_SECONDS, query_string=True, response_filter=is_cacheable)
 def get_research_areas():
     """Get tracked research areas"""
-    metadata = memory.load_metadata()
+    metadata = get_memory().load_metadata()
     research_areas = metadata.get("tracked_research_areas", [])
     return jsonify(research_areas)
 
@@ -291,7 +487,8 @@ def update_research_areas():
         return jsonify({"error": "research_areas must be a list"}), 400
     
     try:
-        monitor_service.set_research_areas(research_areas)
+        get_monitor_service().set_research_areas(research_areas)
+        cache.clear()
         return jsonify({
             "success": True,
             "message": f"Updated research areas: {', '.join(research_areas)}"
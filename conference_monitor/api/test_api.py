@@ -5,6 +5,8 @@ Tests the actual API endpoints using real credentials
 import pytest
 import json
 import os
+import time
+import orjson
 from dotenv import load_dotenv
 from unittest import mock
 
@@ -21,6 +23,16 @@ def client():
     with app.test_client() as client:
         yield client
 
+def wait_for_job(client, job_id, timeout=600):
+    """Poll a background job until it finishes and return its final state"""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        data = orjson.loads(client.get(f'/api/jobs/{job_id}').data)
+        if data['state'] != 'pending':
+            return data
+        time.sleep(1)
+    pytest.fail(f"Job {job_id} did not finish within {timeout} seconds")
+
 def test_api_status(client):
     """Test the API status endpoint"""
     response = client.get('/api/status')
@@ -29,7 +41,7 @@ def test_api_status(client):
     assert response.status_code == 200
     
     # Parse response data
-    data = json.loads(response.data)
+    data = orjson.loads(response.data)
     
     # Verify response contents
     assert data['status'] == 'online'
@@ -41,7 +53,7 @@ def test_get_research_areas(client):
     response = client.get('/api/research-areas')
     
     assert response.status_code == 200
-    data = json.loads(response.data)
+    data = orjson.loads(response.data)
     assert isinstance(data, list)
     # Verify we have at least one research area
     assert len(data) > 0
@@ -50,7 +62,7 @@ def test_get_conferences(client):
     """Test the get conferences endpoint"""
     response = client.get('/api/conferences')
     assert response.status_code == 200
-    data = json.loads(response.data)
+    data = orjson.loads(response.data)
     assert isinstance(data, list)
     
     # If conferences exist, check their structure
@@ -58,6 +70,27 @@ def test_get_conferences(client):
         assert 'id' in data[0]
         assert 'title' in data[0]
 
+def test_get_research_areas_etag(client):
+    """Test that a matching If-None-Match header yields 304 Not Modified"""
+    response = client.get('/api/research-areas')
+    assert response.status_code == 200
+    etag = response.headers.get('ETag')
+    assert etag
+    
+    response = client.get('/api/research-areas', headers={'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.data == b''
+
+def test_get_conferences_etag(client):
+    """Test that conferences are revalidated against their stored ETag"""
+    response = client.get('/api/conferences')
+    assert response.status_code == 200
+    etag = response.headers.get('ETag')
+    assert etag
+    
+    response = client.get('/api/conferences', headers={'If-None-Match': etag})
+    assert response.status_code == 304
+
 def test_run_query(client):
     """Test the query endpoint"""
     request_data = {
@@ -68,7 +101,7 @@ def test_run_query(client):
                           content_type='application/json')
     
     assert response.status_code == 200
-    data = json.loads(response.data)
+    data = orjson.loads(response.data)
     assert data['success'] == True
     assert isinstance(data['response'], str)
     assert len(data['response']) > 20  # Ensure we have a reasonable response
@@ -82,10 +115,14 @@ def test_refresh_conferences(client):
                          data=json.dumps(request_data),
                          content_type='application/json')
     
-    assert response.status_code == 200
-    data = json.loads(response.data)
+    assert response.status_code == 202
+    data = orjson.loads(response.data)
     assert data['success'] == True
-    assert "results" in data
+    
+    job = wait_for_job(client, data['job_id'])
+    assert job['state'] == 'done'
+    assert job['result']['success'] == True
+    assert "results" in job['result']
 
 def test_refresh_papers(client):
     """Test the refresh papers endpoint"""
@@ -96,32 +133,38 @@ def test_refresh_papers(client):
                          data=json.dumps(request_data),
                          content_type='application/json')
     
-    # Accept either 200 or 500 status code since the paper refresh might encounter errors
-    # but the API should still return a valid JSON response
-    assert response.status_code in [200, 500]
-    data = json.loads(response.data)
+    assert response.status_code == 202
+    data = orjson.loads(response.data)
+    job = wait_for_job(client, data['job_id'])
+    
+    # Accept either outcome since the paper refresh might encounter errors
+    # but the job should still report a properly formatted result
+    assert job['state'] in ['done', 'failed']
     
-    if response.status_code == 200:
-        assert data['success'] == True
-        assert "results" in data
+    if job['state'] == 'done':
+        assert job['result']['success'] == True
+        assert "results" in job['result']
     else:
-        # Even on error, we should have a properly formatted error response
-        assert data['success'] == False
-        assert "message" in data
+        assert "message" in job
+
+def test_get_unknown_job(client):
+    """Test that polling an unknown job id returns 404"""
+    response = client.get('/api/jobs/does-not-exist')
+    assert response.status_code == 404
 
 def test_get_trends(client):
     """Test the get trends endpoint"""
     response = client.get('/api/trends?area=artificial intelligence&count=5')
     
     assert response.status_code == 200
-    data = json.loads(response.data)
+    data = orjson.loads(response.data)
     assert "trends" in data
     
 def test_update_research_areas(client):
     """Test the update research areas endpoint"""
     # Save current research areas to restore later
     response = client.get('/api/research-areas')
-    original_areas = json.loads(response.data)
+    original_areas = orjson.loads(response.data)
     
     # Test updating research areas
     test_areas = ["artificial intelligence", "machine learning", "robotics"]
@@ -133,12 +176,12 @@ def test_update_research_areas(client):
                          content_type='application/json')
     
     assert response.status_code == 200
-    data = json.loads(response.data)
+    data = orjson.loads(response.data)
     assert data['success'] == True
     
     # Verify the update worked
     response = client.get('/api/research-areas')
-    updated_areas = json.loads(response.data)
+    updated_areas = orjson.loads(response.data)
     for area in test_areas:
         assert area in updated_areas
         
@@ -26,6 +26,17 @@ DEFAULT_CONFERENCE_SOURCES = [
     "https://www.neurips.cc/",
 ]
 
+# Hosts that are never slowed down with random request jitter
+TRUSTED_SCRAPE_HOSTS = [
+    "arxiv.org",
+    "openreview.net",
+]
+
+# Fetched pages are cached on disk and revalidated with ETag/Last-Modified
+PAGE_CACHE_FILE = DATA_DIR / "page_cache.db"
+PAGE_CACHE_TTL_SECONDS = 24 * 60 * 60  # Cached pages newer than this are used without a request
+MAX_PAGE_BYTES = 4 * 1024 * 1024  # Larger page bodies are truncated while downloading
+
 # Default research areas to track
 DEFAULT_RESEARCH_AREAS = [
     "artificial intelligence",
@@ -38,8 +49,24 @@ DEFAULT_RESEARCH_AREAS = [
 DEFAULT_REFRESH_INTERVAL_DAYS = 7  # How often to check for updates
 MAX_PAPERS_PER_QUERY = 50
 MAX_CONFERENCES_TO_TRACK = 20
+MAX_REFRESH_WORKERS = 8  # Research areas searched concurrently during a refresh
+
+# API settings
+API_CACHE_TIMEOUT_SECONDS = 300  # How long GET responses are cached between refreshes
+API_MAX_PAGE_SIZE = 500  # Largest number of conferences returned per request
 
 # LLM Settings
 DEFAULT_LLM_MODEL = "gemini-2.0-flash-001"  # Google Gemini model
 DEFAULT_LLM_PROVIDER = "google"  # "google" or "openai"
-DEFAULT_EMBEDDING_MODEL = "text-embedding-3-small" 
\ No newline at end of file
+API_KEY_VALIDATION_TTL_SECONDS = 24 * 60 * 60  # How long a successful key check is trusted
+DEFAULT_EMBEDDING_MODEL = "text-embedding-3-small"
+DEFAULT_GOOGLE_EMBEDDING_MODEL = "models/embedding-001"
+LLM_CACHE_SIMILARITY_THRESHOLD = 0.95  # Cosine similarity for reusing a cached response
+LLM_RESPONSE_CACHE_SIZE = 256  # Recently used LLM responses kept in process
+MAX_CONCURRENT_LLM_REQUESTS = 8  # In-flight requests when analyzing papers in batch
+LLM_MAX_RETRIES = 6  # Retries, with exponential backoff, for rate-limited or failed LLM requests
+PAPER_ANALYSIS_BATCH_SIZE = 8  # Papers analyzed per LLM request
+
+# Logging settings
+LOG_MAX_BYTES = 10_000_000  # Size at which the log file is rotated
+LOG_BACKUP_COUNT = 3  # Rotated log files kept
\ No newline at end of file
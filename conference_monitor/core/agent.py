@@ -1,18 +1,37 @@
 """
 Base agent implementation for the Conference Monitor Agent
 """
-from typing import Dict, List, Any, Optional
+from typing import Coroutine, Dict, Iterable, Iterator, List, Any, Optional, Tuple, TypeVar
+import asyncio
+from collections import OrderedDict
+import hashlib
 import logging
+import re
+import threading
+import time
+import numpy as np
+import orjson
 import requests
-from langchain_openai import ChatOpenAI
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain.chains import LLMChain
-from langchain.prompts import PromptTemplate
+from langchain_openai import ChatOpenAI, OpenAIEmbeddings
+from langchain_google_genai import ChatGoogleGenerativeAI, GoogleGenerativeAIEmbeddings
+from langchain_core.messages import SystemMessage
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.output_parsers import StrOutputParser
+from langchain_core.runnables import Runnable
 from langchain.memory import ConversationBufferMemory
 
 from conference_monitor.config import (
+    API_KEY_VALIDATION_TTL_SECONDS,
+    DATA_DIR,
     DEFAULT_LLM_MODEL, 
     DEFAULT_LLM_PROVIDER,
+    DEFAULT_EMBEDDING_MODEL,
+    DEFAULT_GOOGLE_EMBEDDING_MODEL,
+    LLM_CACHE_SIMILARITY_THRESHOLD,
+    LLM_MAX_RETRIES,
+    LLM_RESPONSE_CACHE_SIZE,
+    MAX_CONCURRENT_LLM_REQUESTS,
+    PAPER_ANALYSIS_BATCH_SIZE,
     OPENAI_API_KEY, 
     GOOGLE_API_KEY
 )
@@ -22,9 +41,91 @@ from conference_monitor.core.memory import AgentMemory
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Bullet ("- ", "• ", "* ") or numbered ("1. ", "1) ") list item lines,
+# captured without surrounding whitespace
+TREND_LINE_PATTERN = re.compile(r'^[^\S\n]*((?:[-•*]|\d+[.)]) .*?)[^\S\n]*$', re.MULTILINE)
+
+# Markdown code fence around a JSON response, e.g. ```json ... ```
+CODE_FENCE_PATTERN = re.compile(r'^```(?:json)?\s*|\s*```$')
+
+# Everything but letters and digits, ignored when comparing paper titles
+TITLE_NOISE_PATTERN = re.compile(r'[\W_]+')
+
+# Prompt instructions. Each prompt starts with its fixed instructions and ends
+# with the paper data, so consecutive requests share a long identical prefix
+# that providers with prompt caching can reuse.
+PAPER_ANALYSIS_INSTRUCTIONS = """Analyze the following research paper.
+
+Please provide:
+1. Key findings (3-5 bullet points)
+2. Main research contributions
+3. Research area/field
+4. Potential applications
+
+---
+Paper:
+"""
+
+PAPERS_BATCH_INSTRUCTIONS = """Analyze each of the following research papers.
+
+Respond with only a JSON array containing one object per paper, in this form:
+[{"index": 1, "key_findings": ["..."], "contributions": "...", "area": "...", "applications": "..."}]
+where "index" is the number in brackets before the paper's title and
+"key_findings" lists 3-5 key findings.
+
+---
+Papers:
+"""
+
+TRENDING_TOPICS_INSTRUCTIONS = """Based on the following recent research papers, identify the top 5 trending topics or research directions.
+For each trend, provide a brief explanation of why it's significant.
+
+---
+Papers:
+"""
+
+# Successful key checks, keyed by the SHA-256 of the key (never the key itself)
+VALIDATED_KEYS_FILE = DATA_DIR / "validated_api_keys.json"
+_validated_keys: Optional[Dict[str, float]] = None
+
+def _load_validated_keys() -> Dict[str, float]:
+    """Load the record of successful API key checks
+    
+    Returns:
+        Dictionary mapping key hashes to the time they were validated
+    """
+    global _validated_keys
+    if _validated_keys is None:
+        try:
+            with open(VALIDATED_KEYS_FILE, 'rb') as f:
+                _validated_keys = orjson.loads(f.read())
+        except (OSError, ValueError):
+            _validated_keys = {}
+    return _validated_keys
+
+def _remember_valid_key(key_hash: str):
+    """Record a successful API key check
+    
+    Args:
+        key_hash: SHA-256 of the validated key
+    """
+    validated_keys = _load_validated_keys()
+    validated_keys[key_hash] = time.time()
+    try:
+        with open(VALIDATED_KEYS_FILE, 'wb') as f:
+            f.write(orjson.dumps(validated_keys))
+    except OSError as e:
+        logger.warning(f"Could not save API key validation: {str(e)}")
+
 def is_valid_google_api_key(api_key: str) -> bool:
     """Test if the Google API key is valid
     
+    Successful checks are remembered for API_KEY_VALIDATION_TTL_SECONDS, so
+    creating several agents does not repeat the network call. Failures are
+    not remembered, since they may be transient.
+    
     Args:
         api_key: Google API key to test
         
@@ -37,6 +138,11 @@ def is_valid_google_api_key(api_key: str) -> bool:
     # Skip validation if the key is a mock key for testing
     if api_key == "mock_google_api_key":
         return True
+    
+    key_hash = hashlib.sha256(api_key.encode('utf-8')).hexdigest()
+    validated_at = _load_validated_keys().get(key_hash)
+    if validated_at is not None and time.time() - validated_at < API_KEY_VALIDATION_TTL_SECONDS:
+        return True
         
     # Test the API key with the generateContent endpoint (same as our test script)
     try:
@@ -62,6 +168,7 @@ def is_valid_google_api_key(api_key: str) -> bool:
         
         # Check if the response is successful
         if response.status_code == 200:
+            _remember_valid_key(key_hash)
             return True
         else:
             error_msg = response.json().get('error', {}).get('message', 'Unknown error')
@@ -111,8 +218,14 @@ class ConferenceAgent:
                     model=model_name,
                     temperature=0.2,
                     google_api_key=self.api_key,
+                    convert_system_message_to_human=True,
+                    max_retries=LLM_MAX_RETRIES,
                     verbose=verbose
                 )
+                self.embeddings = GoogleGenerativeAIEmbeddings(
+                    model=DEFAULT_GOOGLE_EMBEDDING_MODEL,
+                    google_api_key=self.api_key
+                )
                 logger.info(f"Using Google Gemini model: {model_name}")
             except Exception as e:
                 logger.error(f"Error initializing Google Gemini model: {str(e)}")
@@ -122,36 +235,335 @@ class ConferenceAgent:
                 model=model_name,
                 temperature=0.2,
                 openai_api_key=self.api_key,
+                max_retries=LLM_MAX_RETRIES,
                 verbose=verbose
             )
+            self.embeddings = OpenAIEmbeddings(
+                model=DEFAULT_EMBEDDING_MODEL,
+                openai_api_key=self.api_key
+            )
             logger.info(f"Using OpenAI model: {model_name}")
         
         # Initialize memory
         self.memory = AgentMemory()
         self.conversation_memory = ConversationBufferMemory(return_messages=True)
         
+        # Prompt | LLM pipelines keyed by system prompt, built on first use
+        self._chain_cache: Dict[str, Runnable] = {}
+        
+        # Recently used responses, so repeated prompts skip the database lookup
+        self._recent_responses: OrderedDict[str, str] = OrderedDict()
+        
+        # Guards the recent responses and the embedding matrix, which are
+        # updated from the threads of concurrent refreshes
+        self._cache_lock = threading.Lock()
+        
+        # Event loop for async LLM calls, started on first use in its own thread,
+        # so the async clients' connection pools stay bound to a single loop
+        # however many threads submit work
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
+        
+        # Load cached prompt embeddings as one normalized matrix for similarity search
+        # (entries from a different embedding model are skipped by dimension)
+        cached = self.memory.list_cached_embeddings()
+        if cached:
+            dimension = len(cached[-1][1])
+            cached = [(key, emb) for key, emb in cached if len(emb) == dimension]
+        self._cache_keys: List[str] = [key for key, _ in cached]
+        self._cache_vectors = (
+            np.vstack([np.frombuffer(emb, dtype=np.float32) for _, emb in cached])
+            if cached else None
+        )
+        
         if self.verbose:
             logger.info(f"Agent initialized with model: {model_name}")
     
-    def run_query(self, query: str, system_prompt: str = "") -> str:
+    def run_async(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the agent's event loop and wait for its result
+        
+        Args:
+            coroutine: Coroutine using the agent's async methods
+            
+        Returns:
+            The coroutine's result
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self._get_loop()).result()
+    
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Get the event loop used for async LLM calls, starting it on first use
+        
+        Returns:
+            Running event loop
+        """
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever, name="agent-loop", daemon=True).start()
+            return self._loop
+    
+    def run_query(self, query: str, system_prompt: str = "", match_similar: bool = False) -> str:
         """Run a simple query through the LLM
         
+        Responses are cached: an identical prompt is answered from the cache.
+        With match_similar, a prompt whose embedding is close enough to a
+        cached one also reuses that response. Only use it for free-form
+        queries; templated prompts that differ in a single paper embed almost
+        identically.
+        
         Args:
             query: The query to process
             system_prompt: Optional system prompt to prepend
+            match_similar: Whether to answer from the cached response of a similar prompt
             
         Returns:
             The LLM's response as a string
         """
+        prompt_text, cache_key = self._prompt_key(query, system_prompt)
+        
+        cached_response = self._get_cached_response(cache_key)
+        if cached_response is not None:
+            return cached_response
+        
+        embedding = self._embed_prompt(prompt_text) if match_similar else None
+        if embedding is not None:
+            similar_response = self._find_similar_response(embedding)
+            if similar_response is not None:
+                return similar_response
+        
         try:
-            prompt_template = f"{system_prompt}\n\n{{query}}" if system_prompt else "{query}"
-            prompt = PromptTemplate(template=prompt_template, input_variables=["query"])
-            chain = LLMChain(llm=self.llm, prompt=prompt)
-            response = chain.run(query=query)
-            return response
+            response = self._get_chain(system_prompt).invoke({"query": query})
         except Exception as e:
             logger.error(f"Error running query: {str(e)}")
             return f"Error processing query: {str(e)}"
+        
+        self._cache_response(cache_key, response, embedding)
+        return response
+    
+    async def arun_query(self, query: str, system_prompt: str = "") -> str:
+        """Run a simple query through the LLM without blocking the event loop
+        
+        Uses the same exact-prompt response cache as run_query. Unlike
+        run_query, LLM errors are raised rather than returned as text.
+        
+        Args:
+            query: The query to process
+            system_prompt: Optional system prompt to prepend
+            
+        Returns:
+            The LLM's response as a string
+        """
+        _, cache_key = self._prompt_key(query, system_prompt)
+        
+        cached_response = self._get_cached_response(cache_key)
+        if cached_response is not None:
+            return cached_response
+        
+        response = await self._get_chain(system_prompt).ainvoke({"query": query})
+        
+        self._cache_response(cache_key, response, None)
+        return response
+    
+    def stream_query(self, query: str, system_prompt: str = "", match_similar: bool = False) -> Iterator[str]:
+        """Run a query through the LLM, yielding the response as it is generated
+        
+        Uses the same response cache as run_query; cached responses are
+        yielded in one piece. Errors are logged and end the stream.
+        
+        Args:
+            query: The query to process
+            system_prompt: Optional system prompt to prepend
+            match_similar: Whether to answer from the cached response of a similar prompt
+            
+        Yields:
+            Chunks of the LLM's response
+        """
+        prompt_text, cache_key = self._prompt_key(query, system_prompt)
+        
+        cached_response = self._get_cached_response(cache_key)
+        if cached_response is not None:
+            yield cached_response
+            return
+        
+        embedding = self._embed_prompt(prompt_text) if match_similar else None
+        if embedding is not None:
+            similar_response = self._find_similar_response(embedding)
+            if similar_response is not None:
+                yield similar_response
+                return
+        
+        chunks = []
+        try:
+            for chunk in self._get_chain(system_prompt).stream({"query": query}):
+                chunks.append(chunk)
+                yield chunk
+        except Exception as e:
+            logger.error(f"Error streaming query: {str(e)}")
+            return
+        
+        self._cache_response(cache_key, "".join(chunks), embedding)
+    
+    @staticmethod
+    def _iter_lines(chunks: Iterable[str]) -> Iterator[str]:
+        """Split a stream of text chunks into complete lines
+        
+        Args:
+            chunks: Text chunks in order
+            
+        Yields:
+            Lines without their trailing newline
+        """
+        buffer = ""
+        for chunk in chunks:
+            buffer += chunk
+            *lines, buffer = buffer.split("\n")
+            yield from lines
+        if buffer:
+            yield buffer
+    
+    @staticmethod
+    def _prompt_key(query: str, system_prompt: str) -> Tuple[str, str]:
+        """Build the cache identity of a prompt
+        
+        Args:
+            query: The query to process
+            system_prompt: System prompt to prepend, may be empty
+            
+        Returns:
+            Tuple of the text to embed and its exact-match cache key
+        """
+        prompt_text = f"{system_prompt}\0{query}"
+        return prompt_text, hashlib.sha256(prompt_text.encode('utf-8')).hexdigest()
+    
+    def _get_chain(self, system_prompt: str) -> Runnable:
+        """Get the prompt | LLM pipeline for a system prompt
+        
+        Args:
+            system_prompt: System prompt to prepend, may be empty
+            
+        Returns:
+            Runnable taking {"query": ...} and returning the response text
+        """
+        chain = self._chain_cache.get(system_prompt)
+        if chain is None:
+            messages = [("user", "{query}")]
+            if system_prompt:
+                # Message object, so braces in the system prompt are not parsed as variables
+                messages.insert(0, SystemMessage(content=system_prompt))
+            prompt = ChatPromptTemplate.from_messages(messages)
+            chain = prompt | self.llm | StrOutputParser()
+            self._chain_cache[system_prompt] = chain
+        return chain
+    
+    def _embed_prompt(self, prompt_text: str) -> Optional[np.ndarray]:
+        """Embed a prompt for semantic cache lookups
+        
+        Args:
+            prompt_text: Prompt to embed
+            
+        Returns:
+            Unit-length float32 embedding, or None if embedding failed
+        """
+        try:
+            return self._unit_vector(self.embeddings.embed_query(prompt_text))
+        except Exception as e:
+            logger.warning(f"Error embedding prompt for cache lookup: {str(e)}")
+            return None
+    
+    @staticmethod
+    def _unit_vector(values: List[float]) -> Optional[np.ndarray]:
+        """Normalize an embedding to unit length
+        
+        Args:
+            values: Raw embedding values
+            
+        Returns:
+            Unit-length float32 vector, or None for a zero vector
+        """
+        vector = np.asarray(values, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else None
+    
+    def _find_similar_response(self, embedding: np.ndarray) -> Optional[str]:
+        """Find a cached response for a semantically similar prompt
+        
+        Args:
+            embedding: Unit-length embedding of the prompt
+            
+        Returns:
+            Cached response or None if no prompt is similar enough
+        """
+        with self._cache_lock:
+            cache_keys, cache_vectors = self._cache_keys, self._cache_vectors
+        
+        if cache_vectors is None or cache_vectors.shape[1] != embedding.shape[0]:
+            return None
+        
+        similarities = cache_vectors @ embedding
+        best = int(np.argmax(similarities))
+        
+        if similarities[best] < LLM_CACHE_SIMILARITY_THRESHOLD:
+            return None
+        
+        return self._get_cached_response(cache_keys[best])
+    
+    def _get_cached_response(self, cache_key: str) -> Optional[str]:
+        """Look up a cached response, checking recent responses before the database
+        
+        Args:
+            cache_key: Hash of the prompt
+            
+        Returns:
+            Cached response or None if not found
+        """
+        with self._cache_lock:
+            response = self._recent_responses.get(cache_key)
+            if response is not None:
+                self._recent_responses.move_to_end(cache_key)
+                return response
+        
+        response = self.memory.get_cached_response(cache_key)
+        if response is not None:
+            self._remember_response(cache_key, response)
+        return response
+    
+    def _remember_response(self, cache_key: str, response: str):
+        """Keep a response among the recent responses, evicting the least recently used
+        
+        Args:
+            cache_key: Hash of the prompt
+            response: LLM response
+        """
+        with self._cache_lock:
+            self._recent_responses[cache_key] = response
+            self._recent_responses.move_to_end(cache_key)
+            while len(self._recent_responses) > LLM_RESPONSE_CACHE_SIZE:
+                self._recent_responses.popitem(last=False)
+    
+    def _cache_response(self, cache_key: str, response: str, embedding: Optional[np.ndarray]):
+        """Store a response in the LLM cache
+        
+        Args:
+            cache_key: Hash of the prompt
+            response: LLM response
+            embedding: Unit-length embedding of the prompt, if available
+        """
+        self._remember_response(cache_key, response)
+        self.memory.save_cached_response(
+            cache_key,
+            response,
+            embedding.tobytes() if embedding is not None else None
+        )
+        
+        if embedding is not None:
+            # Replace rather than extend the key list, so snapshots taken by
+            # _find_similar_response stay aligned with their matrix
+            with self._cache_lock:
+                self._cache_keys = self._cache_keys + [cache_key]
+                if self._cache_vectors is None:
+                    self._cache_vectors = embedding[np.newaxis, :]
+                else:
+                    self._cache_vectors = np.vstack([self._cache_vectors, embedding])
     
     def analyze_paper(self, paper_data: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze a research paper and extract key information
@@ -162,33 +574,196 @@ class ConferenceAgent:
         Returns:
             Dictionary with analysis results
         """
-        title = paper_data.get("title", "")
-        abstract = paper_data.get("abstract", "")
-        
-        if not title or not abstract:
+        query = self._paper_analysis_query(paper_data)
+        if query is None:
             return {"error": "Paper data missing required fields (title, abstract)"}
         
-        query = f"""
-        Analyze the following research paper:
+        return self._paper_analysis_result(paper_data, self.run_query(query))
+    
+    async def analyze_papers_batch(self, papers: List[Dict[str, Any]],
+                                   batch_size: int = PAPER_ANALYSIS_BATCH_SIZE,
+                                   max_concurrency: int = MAX_CONCURRENT_LLM_REQUESTS) -> List[Optional[Dict[str, Any]]]:
+        """Analyze several papers, packing up to `batch_size` papers into each LLM request
         
-        Title: {title}
-        Abstract: {abstract}
+        Papers the LLM leaves out of a batch response are analyzed individually.
+        When a batch request itself fails, its papers are left unanalyzed rather
+        than retried one by one, which would multiply requests while rate limited.
+        Papers without a title or abstract get an error result.
         
-        Please provide:
-        1. Key findings (3-5 bullet points)
-        2. Main research contributions
-        3. Research area/field
-        4. Potential applications
+        Args:
+            papers: List of paper data dictionaries
+            batch_size: Maximum number of papers per request
+            max_concurrency: Maximum number of requests in flight at once
+            
+        Returns:
+            Analysis results in the same order as the papers, None where analysis failed
         """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        analyses: List[Optional[Dict[str, Any]]] = [None] * len(papers)
+        
+        pending = []
+        for i, paper_data in enumerate(papers):
+            if self._paper_analysis_query(paper_data) is None:
+                analyses[i] = {"error": "Paper data missing required fields (title, abstract)"}
+            else:
+                pending.append(i)
+        
+        async def analyze_batch(indices: List[int]):
+            batch = [papers[i] for i in indices]
+            try:
+                async with semaphore:
+                    response = await self.arun_query(self._papers_batch_query(batch))
+            except Exception as e:
+                logger.error(f"Error analyzing batch of {len(batch)} papers: {str(e)}")
+                return
+            
+            items = self._parse_batch_analyses(response, len(batch))
+            for position, i in enumerate(indices, 1):
+                item = items.get(position)
+                if item is not None:
+                    analyses[i] = self._paper_analysis_result(papers[i], self._format_paper_analysis(item))
+                else:
+                    try:
+                        async with semaphore:
+                            analysis = await self.arun_query(self._paper_analysis_query(papers[i]))
+                    except Exception as e:
+                        logger.error(f"Error analyzing paper {papers[i].get('id', '')}: {str(e)}")
+                        continue
+                    analyses[i] = self._paper_analysis_result(papers[i], analysis)
         
-        analysis = self.run_query(query)
+        batches = [pending[k:k + batch_size] for k in range(0, len(pending), batch_size)]
+        results = await asyncio.gather(*(analyze_batch(indices) for indices in batches), return_exceptions=True)
         
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Error analyzing papers: {str(result)}")
+        return analyses
+    
+    @staticmethod
+    def _papers_batch_query(papers: List[Dict[str, Any]]) -> str:
+        """Build one analysis prompt covering several papers
+        
+        Args:
+            papers: List of paper data dictionaries with title and abstract
+            
+        Returns:
+            Prompt asking for a JSON array with one analysis per paper
+        """
+        papers_text = "\n\n".join(
+            f"[{i}] Title: {paper.get('title', '')}\nAbstract: {paper.get('abstract', '')}"
+            for i, paper in enumerate(papers, 1)
+        )
+        
+        return PAPERS_BATCH_INSTRUCTIONS + papers_text
+    
+    @staticmethod
+    def _parse_batch_analyses(response: str, count: int) -> Dict[int, Dict[str, Any]]:
+        """Parse the JSON array returned for a batch analysis prompt
+        
+        Args:
+            response: LLM response text, possibly wrapped in a code fence
+            count: Number of papers in the batch
+            
+        Returns:
+            Analysis objects keyed by 1-based paper index; empty if the response is not valid JSON
+        """
+        try:
+            items = orjson.loads(CODE_FENCE_PATTERN.sub("", response.strip()))
+        except (ValueError, TypeError):
+            logger.warning("Could not parse batch paper analysis, analyzing papers individually")
+            return {}
+        
+        if not isinstance(items, list):
+            return {}
+        
+        parsed = {}
+        for item in items:
+            if isinstance(item, dict) and isinstance(item.get("index"), int) and 1 <= item["index"] <= count:
+                parsed[item["index"]] = item
+        return parsed
+    
+    @staticmethod
+    def _format_paper_analysis(item: Dict[str, Any]) -> str:
+        """Render a structured paper analysis in the single-paper text layout
+        
+        Args:
+            item: Analysis object from a batch response
+            
+        Returns:
+            Analysis text
+        """
+        findings = item.get("key_findings") or []
+        if isinstance(findings, str):
+            findings = [findings]
+        
+        return "\n".join([
+            "1. Key findings:",
+            *(f"- {finding}" for finding in findings),
+            f"2. Main research contributions: {item.get('contributions', '')}",
+            f"3. Research area/field: {item.get('area', '')}",
+            f"4. Potential applications: {item.get('applications', '')}"
+        ])
+    
+    @staticmethod
+    def _paper_analysis_query(paper_data: Dict[str, Any]) -> Optional[str]:
+        """Build the analysis prompt for a paper
+        
+        Args:
+            paper_data: Dictionary containing paper metadata
+            
+        Returns:
+            Prompt text, or None if the paper has no title or abstract
+        """
+        title = paper_data.get("title", "")
+        abstract = paper_data.get("abstract", "")
+        
+        if not title or not abstract:
+            return None
+        
+        return f"{PAPER_ANALYSIS_INSTRUCTIONS}Title: {title}\nAbstract: {abstract}"
+    
+    @staticmethod
+    def _paper_analysis_result(paper_data: Dict[str, Any], analysis: str) -> Dict[str, Any]:
+        """Package an LLM analysis for a paper
+        
+        Args:
+            paper_data: Dictionary containing paper metadata
+            analysis: LLM response text
+            
+        Returns:
+            Dictionary with analysis results
+        """
         return {
             "paper_id": paper_data.get("id", ""),
-            "title": title,
+            "title": paper_data.get("title", ""),
             "analysis": analysis
         }
     
+    @staticmethod
+    def _dedupe_papers(papers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Drop papers whose title was already seen
+        
+        Titles are compared ignoring case, spacing and punctuation, so mirrored
+        or re-crawled copies of the same paper are only sent to the LLM once.
+        
+        Args:
+            papers: List of paper data dictionaries
+            
+        Returns:
+            First occurrence of each paper, in original order
+        """
+        seen = set()
+        unique = []
+        for paper in papers:
+            title = TITLE_NOISE_PATTERN.sub(' ', paper.get('title') or '').strip().lower()
+            if title:
+                title_hash = hashlib.blake2b(title.encode(), digest_size=8).digest()
+                if title_hash in seen:
+                    continue
+                seen.add(title_hash)
+            unique.append(paper)
+        return unique
+    
     def identify_trending_topics(self, papers: List[Dict[str, Any]]) -> List[str]:
         """Identify trending topics from a collection of papers
         
@@ -198,30 +773,25 @@ class ConferenceAgent:
         Returns:
             List of trending topic strings
         """
-        # Prepare paper data for LLM
-        paper_info = []
-        for i, paper in enumerate(papers[:20]):  # Limit to 20 papers for token constraints
-            paper_info.append(f"{i+1}. {paper.get('title', 'Unknown')} - {paper.get('abstract', 'No abstract')[:200]}...")
-        
-        papers_text = "\n\n".join(paper_info)
-        
-        query = f"""
-        Based on the following recent research papers, identify the top 5 trending topics or research directions.
-        For each trend, provide a brief explanation of why it's significant.
-        
-        Papers:
-        {papers_text}
-        """
+        # Prepare paper data for LLM (limit to 20 papers for token constraints)
+        selected = self._dedupe_papers(papers)[:20]
+        papers_text = "\n\n".join(
+            f"{i}. {paper.get('title', 'Unknown')} - {paper.get('abstract', 'No abstract')[:200]}..."
+            for i, paper in enumerate(selected, 1)
+        )
         
-        response = self.run_query(query)
+        query = TRENDING_TOPICS_INSTRUCTIONS + papers_text
         
-        # Process response
+        # Parse trend lines as they arrive instead of waiting for the full response
         trends = []
-        if response and ":" in response:
-            for line in response.split("\n"):
-                line = line.strip()
-                if line and (line.startswith(("- ", "• ", "* ")) or
-                             (line[0].isdigit() and line[1:].startswith((". ", ") ")))):
-                    trends.append(line)
+        has_colon = False
+        for line in self._iter_lines(self.stream_query(query)):
+            has_colon = has_colon or ":" in line
+            match = TREND_LINE_PATTERN.match(line)
+            if match:
+                trends.append(match.group(1))
+        
+        if not has_colon:
+            trends = []
         
         return trends or ["No clear trends identified"] 
\ No newline at end of file
@@ -2,78 +2,439 @@
 Browser management for web scraping
 """
 import requests
-from typing import Dict, List, Any, Optional
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+import urllib3
+from urllib3.util.retry import Retry
+from typing import Dict, List, Any, Optional, Tuple
+from bs4 import BeautifulSoup, SoupStrainer
+import lxml.html
+from lxml import etree
 import logging
+import os
 from urllib.parse import urljoin, urlparse
+from pathlib import Path
 import re
+import sqlite3
+import threading
 import time
 import random
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from conference_monitor.config import MAX_PAGE_BYTES, PAGE_CACHE_FILE, PAGE_CACHE_TTL_SECONDS, TRUSTED_SCRAPE_HOSTS
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Unverified fetches are intentional and logged once per host by get_page,
+# so urllib3's per-request warning is only noise
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+# Patterns used by find_conference_info, compiled once at import
+DATE_PATTERN = re.compile(
+    r'\b(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s+\d{1,2}(?:-|–|to|\s+through\s+)?\d{1,2}?,?\s+\d{4}\b',
+    re.IGNORECASE
+)
+
+# "Submission deadline: ..." and "Deadline for papers: ..." phrasings in one
+# alternation, so the text is scanned once
+DEADLINE_PATTERN = re.compile(
+    r'(?:(?:submission|paper|abstract)(?:\s+(?:deadline|due|date))?'
+    r'|(?:deadline|due date)(?:\s+for)?(?:\s+(?:submissions|papers|abstracts))?)'
+    r'\s*(?::|is|are|on|by)?\s*([A-Za-z]+\s+\d{1,2},?\s+\d{4})',
+    re.IGNORECASE
+)
+
+# Words at least one of which appears in any deadline match
+DEADLINE_KEYWORDS = ('submission', 'paper', 'abstract', 'deadline', 'due date')
+
+# Tags searched, in document order, for the conference title
+TITLE_TAGS = ('h1', 'h2', 'h3')
+
+# Tags whose contents are not page text
+NON_TEXT_TAGS = ('script', 'style', 'template')
+
+# Case-sensitive on purpose: locations are matched as capitalized names
+LOCATION_PATTERNS = [
+    re.compile(r'(?:held|located|location|venue|take[s]? place|will be in)(?:\s+in|\s+at)?\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*,\s+[A-Za-z\s]+)'),
+    re.compile(r'(?:in|at)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*,\s+[A-Za-z\s]+)')
+]
+
+# Bytes read from a response body per iteration
+PAGE_CHUNK_SIZE = 64 * 1024
+
+# Parsed pages kept in memory; full trees are large, so keep only a few
+PARSED_PAGE_CACHE_SIZE = 32
+
+def _element_text(element: lxml.html.HtmlElement) -> str:
+    """Get the text of an element, like BeautifulSoup's get_text(strip=True)
+    
+    Args:
+        element: Parsed HTML element
+        
+    Returns:
+        Stripped text pieces joined together
+    """
+    return ''.join(part.strip() for part in element.itertext())
+
+@lru_cache(maxsize=PARSED_PAGE_CACHE_SIZE)
+def _parse(html: str) -> Tuple[Optional[lxml.html.HtmlElement], str]:
+    """Parse HTML once and extract its text
+    
+    Callers must treat the returned tree as read-only, since it is shared
+    between everyone analyzing the same page.
+    
+    Args:
+        html: HTML content to parse
+        
+    Returns:
+        Tuple of (tree, text content); the tree is None if the page has no markup
+    """
+    try:
+        try:
+            tree = lxml.html.fromstring(html)
+        except ValueError:
+            # Strings with an XML encoding declaration must be parsed as bytes
+            tree = lxml.html.fromstring(html.encode('utf-8'))
+    except Exception as e:
+        logger.warning(f"Could not parse page: {str(e)}")
+        return None, ''
+    
+    # Scripts and styles are not page text
+    etree.strip_elements(tree, *NON_TEXT_TAGS, with_tail=False)
+    return tree, str(tree.text_content())
+
+def _extract_conference_info(html: Optional[str]) -> Dict[str, Any]:
+    """Extract conference information from HTML
+    
+    Args:
+        html: HTML content to parse
+        
+    Returns:
+        Dictionary with extracted conference information
+    """
+    if not html:
+        return {}
+    
+    # Text is extracted once here and reused by every regex pass below
+    tree, text_content = _parse(html)
+    if tree is None:
+        return {}
+    
+    # Initialize conference info
+    conf_info = {
+        'title': None,
+        'dates': None,
+        'location': None,
+        'deadlines': [],
+        'website': None,
+        'description': None
+    }
+    
+    # Extract title (usually in h1 or h2 tags)
+    # Walk the tree lazily; the loop usually stops at one of the first headings
+    for tag in tree.iter(*TITLE_TAGS):
+        text = _element_text(tag)
+        if len(text) > 5 and len(text) < 150:  # Reasonable length for a title
+            conf_info['title'] = text
+            break
+    
+    # Look for dates (using regex patterns)
+    # Only the first match is used, so stop scanning once it is found
+    date_match = DATE_PATTERN.search(text_content)
+    if date_match:
+        conf_info['dates'] = date_match.group(0)
+    
+    # Look for submission deadlines
+    # Every deadline match needs one of these words, so pages without
+    # them skip the regex scan entirely
+    lowered = text_content.lower()
+    if any(keyword in lowered for keyword in DEADLINE_KEYWORDS):
+        conf_info['deadlines'] = DEADLINE_PATTERN.findall(text_content)
+    
+    # Try to extract location
+    for pattern in LOCATION_PATTERNS:
+        location_match = pattern.search(text_content)
+        if location_match:
+            conf_info['location'] = location_match.group(1)
+            break
+    
+    # Extract description (look for paragraphs with a reasonable length)
+    for p in tree.iter('p'):
+        text = _element_text(p)
+        if len(text) > 100 and len(text) < 1000:  # Reasonable length for a description
+            conf_info['description'] = text
+            break
+    
+    return conf_info
+
 class BrowserManager:
     """Manages web browsing and content extraction"""
     
-    def __init__(self, headers: Optional[Dict[str, str]] = None, timeout: int = 10):
+    def __init__(self, headers: Optional[Dict[str, str]] = None, timeout: int = 10,
+                 jitter: bool = False, trusted_hosts: Optional[List[str]] = None,
+                 cache_path: Optional[Path] = PAGE_CACHE_FILE):
         """Initialize the browser manager
         
         Args:
             headers: Custom headers for HTTP requests
             timeout: Timeout for HTTP requests in seconds
+            jitter: Whether to add a small random delay to requests to untrusted hosts
+            trusted_hosts: Hosts (and their subdomains) that never get jitter
+            cache_path: SQLite file for cached pages, or None to disable caching
         """
         self.timeout = timeout
+        self.jitter = jitter
+        self.trusted_hosts = trusted_hosts if trusted_hosts is not None else TRUSTED_SCRAPE_HOSTS
         self.headers = headers or {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
             "Accept-Language": "en-US,en;q=0.5"
         }
         
-        # Used to avoid overloading servers
-        self.last_request_time = 0
+        # Keep-alive connection pool shared by all requests, retrying
+        # transient failures with backoff
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=frozenset(['GET', 'HEAD'])
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Used to avoid overloading servers: the earliest time the next
+        # request to each host may start
         self.min_request_interval = 1  # seconds
+        self._next_request_time: Dict[str, float] = {}
+        self._throttle_lock = threading.Lock()
+        
+        # Hosts already warned about for unverified fetches
+        self._unverified_hosts = set()
+        
+        # Worker threads for parsing, started on first use
+        self._parse_pool: Optional[ThreadPoolExecutor] = None
+        self._parse_pool_lock = threading.Lock()
+        
+        # On-disk page cache, shared by the get_pages worker threads
+        self._cache_conn = None
+        self._cache_lock = threading.Lock()
+        if cache_path is not None:
+            try:
+                self._cache_conn = sqlite3.connect(str(cache_path), check_same_thread=False)
+                self._cache_conn.execute('PRAGMA journal_mode=WAL')
+                self._cache_conn.execute('''
+                CREATE TABLE IF NOT EXISTS pages (
+                    url TEXT PRIMARY KEY,
+                    etag TEXT,
+                    last_modified TEXT,
+                    body TEXT,
+                    fetched_at REAL
+                )
+                ''')
+                self._cache_conn.commit()
+            except Exception as e:
+                logger.error(f"Error opening page cache: {str(e)}")
+                self._cache_conn = None
+    
+    def close(self):
+        """Release the connection pool, parsing workers and page cache"""
+        self.session.close()
+        with self._parse_pool_lock:
+            if self._parse_pool is not None:
+                self._parse_pool.shutdown()
+                self._parse_pool = None
+        if self._cache_conn is not None:
+            with self._cache_lock:
+                self._cache_conn.close()
+                self._cache_conn = None
+    
+    def __enter__(self) -> "BrowserManager":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
-    def _throttle_requests(self):
-        """Throttle requests to avoid overloading servers"""
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
+    def _throttle_requests(self, url: str):
+        """Throttle requests to avoid overloading servers
         
-        if time_since_last_request < self.min_request_interval:
-            sleep_time = self.min_request_interval - time_since_last_request
-            time.sleep(sleep_time)
+        Requests to the same host are spaced by min_request_interval, while
+        requests to different hosts do not wait for each other.
         
-        self.last_request_time = time.time()
+        Args:
+            url: URL about to be fetched
+        """
+        host = urlparse(url).netloc
+        interval = self.min_request_interval
+        if self.jitter and not self._is_trusted_host(host):
+            interval += random.uniform(0, 0.3)
+        
+        # Reserve the next free slot for this host, then wait outside the lock
+        with self._throttle_lock:
+            current_time = time.time()
+            start_time = max(current_time, self._next_request_time.get(host, 0))
+            self._next_request_time[host] = start_time + interval
+        
+        if start_time > current_time:
+            time.sleep(start_time - current_time)
     
-    def get_page(self, url: str) -> Optional[str]:
+    def _is_trusted_host(self, host: str) -> bool:
+        """Check whether a host is in the trusted hosts list
+        
+        Args:
+            host: Network location of a URL
+            
+        Returns:
+            True if the host or one of its parent domains is trusted
+        """
+        host = host.split(':')[0].lower()
+        return any(host == trusted or host.endswith(f".{trusted}") for trusted in self.trusted_hosts)
+    
+    def get_page(self, url: str, verify: bool = True) -> Optional[str]:
         """Fetch a web page
         
         Args:
             url: URL to fetch
+            verify: Whether to verify the server's SSL certificate
             
         Returns:
             HTML content as string or None if failed
         """
-        self._throttle_requests()
+        cached = self._get_cached_page(url)
+        if cached and time.time() - cached['fetched_at'] < PAGE_CACHE_TTL_SECONDS:
+            return cached['body']
+        
+        # Ask the server whether our copy is still current
+        headers = {}
+        if cached:
+            if cached['etag']:
+                headers['If-None-Match'] = cached['etag']
+            if cached['last_modified']:
+                headers['If-Modified-Since'] = cached['last_modified']
+        
+        # Log warning about SSL verification, once per host
+        host = urlparse(url).netloc
+        if not verify and url.startswith("https") and host not in self._unverified_hosts:
+            self._unverified_hosts.add(host)
+            logger.warning("SSL certificate verification disabled for: %s", host)
+        
+        self._throttle_requests(url)
         
         try:
-            # Add jitter to be more human-like
-            time.sleep(random.uniform(0.5, 1.5))
+            with self.session.get(url, headers=headers, timeout=self.timeout, verify=verify, stream=True) as response:
+                if response.status_code == 304 and cached:
+                    self._cache_page(url, cached['body'], cached['etag'], cached['last_modified'])
+                    return cached['body']
+                elif response.status_code == 200:
+                    body = self._read_body(response)
+                    self._cache_page(url, body, response.headers.get('ETag'),
+                                     response.headers.get('Last-Modified'))
+                    return body
+                else:
+                    logger.warning(f"Failed to fetch {url}, status code: {response.status_code}")
+                    return None
+        except requests.exceptions.RequestException as e:
+            # Transient failures were already retried by the session's adapter
+            logger.warning(f"Error fetching {url}: {str(e)}")
+            return None
+    
+    @staticmethod
+    def _read_body(response: requests.Response) -> str:
+        """Read a streamed response body, stopping at MAX_PAGE_BYTES
+        
+        Args:
+            response: Response opened with stream=True
             
-            response = requests.get(
-                url, 
-                headers=self.headers, 
-                timeout=self.timeout
-            )
+        Returns:
+            Decoded body, truncated if the page is larger than the limit
+        """
+        body = bytearray()
+        for chunk in response.iter_content(chunk_size=PAGE_CHUNK_SIZE):
+            body += chunk
+            if len(body) > MAX_PAGE_BYTES:
+                logger.warning(f"Truncating {response.url} to {MAX_PAGE_BYTES} bytes")
+                del body[MAX_PAGE_BYTES:]
+                break
+        
+        try:
+            return body.decode(response.encoding or 'utf-8', errors='replace')
+        except LookupError:
+            # Unknown charset in the Content-Type header
+            return body.decode('utf-8', errors='replace')
+    
+    def _get_cached_page(self, url: str) -> Optional[Dict[str, Any]]:
+        """Look up a page in the on-disk cache
+        
+        Args:
+            url: URL of the page
             
-            if response.status_code == 200:
-                return response.text
-            else:
-                logger.warning(f"Failed to fetch {url}, status code: {response.status_code}")
-                return None
+        Returns:
+            Dictionary with body, etag, last_modified and fetched_at, or None if not cached
+        """
+        if self._cache_conn is None:
+            return None
+        
+        try:
+            with self._cache_lock:
+                row = self._cache_conn.execute(
+                    'SELECT body, etag, last_modified, fetched_at FROM pages WHERE url = ?', (url,)
+                ).fetchone()
         except Exception as e:
-            logger.error(f"Error fetching {url}: {str(e)}")
+            logger.error(f"Error reading page cache for {url}: {str(e)}")
+            return None
+        
+        if row is None:
             return None
+        return {'body': row[0], 'etag': row[1], 'last_modified': row[2], 'fetched_at': row[3]}
+    
+    def _cache_page(self, url: str, body: str, etag: Optional[str], last_modified: Optional[str]):
+        """Store or refresh a page in the on-disk cache
+        
+        Args:
+            url: URL of the page
+            body: HTML content
+            etag: ETag response header, if any
+            last_modified: Last-Modified response header, if any
+        """
+        if self._cache_conn is None:
+            return
+        
+        try:
+            with self._cache_lock, self._cache_conn:
+                self._cache_conn.execute(
+                    'INSERT OR REPLACE INTO pages (url, etag, last_modified, body, fetched_at) VALUES (?, ?, ?, ?, ?)',
+                    (url, etag, last_modified, body, time.time())
+                )
+        except Exception as e:
+            logger.error(f"Error writing page cache for {url}: {str(e)}")
+    
+    def get_pages(self, urls: List[str], max_workers: int = 8) -> List[Optional[str]]:
+        """Fetch several web pages concurrently
+        
+        Pages on different hosts are fetched in parallel; pages on the same
+        host still respect the per-host request interval. Repeated URLs are
+        fetched once.
+        
+        Args:
+            urls: URLs to fetch
+            max_workers: Maximum number of pages fetched at once
+            
+        Returns:
+            HTML content for each URL, in order, with None for failures
+        """
+        if not urls:
+            return []
+        
+        unique_urls = list(dict.fromkeys(urls))
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_urls))) as executor:
+            pages = dict(zip(unique_urls, executor.map(self.get_page, unique_urls)))
+        return [pages[url] for url in urls]
     
     def extract_links(self, html: str, base_url: str) -> List[Dict[str, str]]:
         """Extract links from HTML content
@@ -88,13 +449,10 @@ class BrowserManager:
         if not html:
             return []
         
-        soup = BeautifulSoup(html, 'html.parser')
         links = []
+        base_netloc = urlparse(base_url).netloc
         
-        for a_tag in soup.find_all('a', href=True):
-            href = a_tag['href']
-            text = a_tag.get_text(strip=True)
-            
+        for href, text in self._iter_anchors(html):
             # Skip empty or anchor links
             if not href or href.startswith('#'):
                 continue
@@ -105,11 +463,36 @@ class BrowserManager:
             links.append({
                 'url': full_url,
                 'text': text,
-                'is_external': urlparse(full_url).netloc != urlparse(base_url).netloc
+                'is_external': urlparse(full_url).netloc != base_netloc
             })
         
         return links
     
+    @staticmethod
+    def _iter_anchors(html: str) -> List[Tuple[str, str]]:
+        """Get the href and text of every link in a page
+        
+        Walks the lxml tree directly, which avoids building a BeautifulSoup
+        object; falls back to BeautifulSoup for markup lxml.html rejects.
+        
+        Args:
+            html: HTML content to parse
+            
+        Returns:
+            List of (href, text) tuples in document order
+        """
+        try:
+            tree = lxml.html.fromstring(html)
+            return [
+                (a_tag.get('href'), _element_text(a_tag))
+                for a_tag in tree.iter('a')
+                if a_tag.get('href') is not None
+            ]
+        except Exception:
+            # Only build the anchor elements; the rest of the page is skipped
+            soup = BeautifulSoup(html, 'lxml', parse_only=SoupStrainer('a', href=True))
+            return [(a_tag['href'], a_tag.get_text(strip=True)) for a_tag in soup.find_all('a', href=True)]
+    
     def find_conference_info(self, html: str) -> Dict[str, Any]:
         """Extract conference information from HTML
         
@@ -119,101 +502,48 @@ class BrowserManager:
         Returns:
             Dictionary with extracted conference information
         """
-        if not html:
-            return {}
-        
-        soup = BeautifulSoup(html, 'html.parser')
-        
-        # Initialize conference info
-        conf_info = {
-            'title': None,
-            'dates': None,
-            'location': None,
-            'deadlines': [],
-            'website': None,
-            'description': None
-        }
+        return _extract_conference_info(html)
+    
+    def find_conference_infos(self, htmls: List[Optional[str]]) -> List[Dict[str, Any]]:
+        """Extract conference information from several pages in parallel
         
-        # Extract title (usually in h1 or h2 tags)
-        title_tags = soup.find_all(['h1', 'h2', 'h3'])
-        for tag in title_tags:
-            text = tag.get_text(strip=True)
-            if len(text) > 5 and len(text) < 150:  # Reasonable length for a title
-                conf_info['title'] = text
-                break
+        Pages are parsed in a pool of worker threads; lxml releases the GIL
+        while parsing.
         
-        # Look for dates (using regex patterns)
-        date_pattern = r'\b(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s+\d{1,2}(?:-|–|to|\s+through\s+)?\d{1,2}?,?\s+\d{4}\b'
-        text_content = soup.get_text()
-        date_matches = re.findall(date_pattern, text_content, re.IGNORECASE)
-        if date_matches:
-            conf_info['dates'] = date_matches[0]
-        
-        # Look for submission deadlines
-        deadline_patterns = [
-            r'(?:submission|paper|abstract)(?:\s+(?:deadline|due|date))?\s*(?::|is|are|on|by)?\s*([A-Za-z]+\s+\d{1,2},?\s+\d{4})',
-            r'(?:deadline|due date)(?:\s+for)?(?:\s+(?:submissions|papers|abstracts))?\s*(?::|is|are|on|by)?\s*([A-Za-z]+\s+\d{1,2},?\s+\d{4})'
-        ]
-        
-        for pattern in deadline_patterns:
-            deadline_matches = re.findall(pattern, text_content, re.IGNORECASE)
-            conf_info['deadlines'].extend(deadline_matches)
-        
-        # Try to extract location
-        location_patterns = [
-            r'(?:held|located|location|venue|take[s]? place|will be in)(?:\s+in|\s+at)?\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*,\s+[A-Za-z\s]+)',
-            r'(?:in|at)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*,\s+[A-Za-z\s]+)'
-        ]
-        
-        for pattern in location_patterns:
-            location_matches = re.findall(pattern, text_content)
-            if location_matches:
-                conf_info['location'] = location_matches[0]
-                break
+        Args:
+            htmls: HTML content of each page, None for pages that failed to load
+            
+        Returns:
+            Conference information for each page, in order
+        """
+        if len([html for html in htmls if html]) < 2:
+            return [_extract_conference_info(html) for html in htmls]
         
-        # Extract description (look for paragraphs with a reasonable length)
-        paragraphs = soup.find_all('p')
-        for p in paragraphs:
-            text = p.get_text(strip=True)
-            if len(text) > 100 and len(text) < 1000:  # Reasonable length for a description
-                conf_info['description'] = text
-                break
+        try:
+            return list(self._get_parse_pool().map(_extract_conference_info, htmls))
+        except Exception as e:
+            logger.error(f"Error parsing pages in worker threads: {str(e)}")
+            return [_extract_conference_info(html) for html in htmls]
+    
+    def _get_parse_pool(self) -> ThreadPoolExecutor:
+        """Get the worker thread pool used for parsing, starting it on first use
         
-        return conf_info
+        Returns:
+            Thread pool executor
+        """
+        with self._parse_pool_lock:
+            if self._parse_pool is None:
+                self._parse_pool = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="parse")
+            return self._parse_pool
 
     def fetch_url(self, url: str) -> str:
-        """Fetch content from a URL
+        """Fetch content from a URL without verifying its SSL certificate
         
         Args:
             url: URL to fetch
             
         Returns:
-            HTML content
+            HTML content, or an empty string if failed
         """
-        try:
-            # Set headers to mimic a browser
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-                "Accept-Language": "en-US,en;q=0.5"
-            }
-            
-            # Disable SSL verification as a workaround for certificate issues
-            response = requests.get(url, headers=headers, timeout=10, verify=False)
-            
-            # Log warning about SSL verification
-            if "https" in url:
-                logger.warning("SSL certificate verification disabled for: %s", url)
-                # Suppress only the InsecureRequestWarning from urllib3
-                import urllib3
-                urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-            
-            # Check status code
-            if response.status_code == 200:
-                return response.text
-            else:
-                logger.error(f"Error fetching {url}: Status code {response.status_code}")
-                return ""
-        except Exception as e:
-            logger.error(f"Error fetching {url}: {str(e)}")
-            return "" 
\ No newline at end of file
+        # Disable SSL verification as a workaround for certificate issues
+        return self.get_page(url, verify=False) or "" 
\ No newline at end of file
@@ -1,36 +1,124 @@
 """
 Agent memory implementation for storing and retrieving agent data
 """
-import json
+from collections import OrderedDict
+import copy
+import operator
 import os
-from typing import Dict, List, Any, Optional
-from datetime import datetime
+import re
+from typing import Callable, Dict, Iterator, List, Any, Optional, Tuple, Union
+from datetime import datetime, timezone
 from pathlib import Path
 import logging
 import sqlite3
+import threading
+import time
+import orjson
+from pydantic.main import BaseModel
 
 from conference_monitor.config import DATA_DIR
+from conference_monitor.models.conference import Conference
+from conference_monitor.models.paper import Paper
 
 logger = logging.getLogger(__name__)
 
+# Applied to every connection opened by AgentMemory. recursive_triggers is
+# needed so INSERT OR REPLACE fires the delete trigger that keeps the FTS
+# index in sync.
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA recursive_triggers=ON",
+)
+
+# Columns covered by the full-text index of each table
+FTS_COLUMNS = {
+    "conferences": ("title", "description", "research_areas"),
+    "papers": ("title", "research_area"),
+}
+
+CONFERENCE_INSERT_SQL = '''
+INSERT OR REPLACE INTO conferences
+(id, title, url, description, dates, start_date, end_date, location, source, research_areas, tier, title_norm, end_epoch, updated_at, last_updated, data)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+# Defaults of the conference keys copied into their own columns, read in
+# column order by a single itemgetter call per row
+CONFERENCE_COLUMN_DEFAULTS = {
+    "url": "", "description": "", "dates": "", "start_date": "", "end_date": "",
+    "location": "", "source": "", "tier": None, "end_epoch": None,
+}
+CONFERENCE_COLUMN_GETTER = operator.itemgetter("url", "description", "dates", "start_date", "end_date", "location", "source")
+
+# Paper columns holding the same string as the matching key of the paper's
+# JSON, so string filters on these keys can be pushed into SQL
+PAPER_FILTER_COLUMNS = ("id", "title", "url", "abstract", "research_area")
+
+TREND_INSERT_SQL = '''
+INSERT OR REPLACE INTO trends (id, created, data) VALUES (?, ?, ?)
+'''
+
+# Conferences and papers kept as raw JSON for repeated get_* lookups
+RECORD_CACHE_SIZE = 4096
+
+# Characters replaced in record IDs (often URLs) to form file names
+UNSAFE_FILENAME_PATTERN = re.compile(r'[\\/:*?"<>|]')
+
+# orjson options for the pretty-printed JSON files; orjson always writes UTF-8
+JSON_FILE_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+PAPER_INSERT_SQL = '''
+INSERT OR REPLACE INTO papers
+(id, title, url, authors, abstract, year, research_area, last_updated, data)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+# Defaults of the paper keys copied into their own columns
+PAPER_COLUMN_DEFAULTS = {"title": "", "url": "", "authors": [], "abstract": "", "year": "", "research_area": ""}
+PAPER_COLUMN_GETTER = operator.itemgetter("id", "title", "url", "authors", "abstract", "year", "research_area")
+
 class AgentMemory:
     """Memory management for the conference monitoring agent"""
     
-    def __init__(self, data_dir: str = "data"):
+    def __init__(self, data_dir: str = "data", json_backup: bool = False):
         """Initialize memory
         
         Args:
             data_dir: Directory for storing data
+            json_backup: Whether to also write each record to its own JSON file;
+                export_to_files writes them all on demand
         """
         self.data_dir = Path(data_dir)
+        self.json_backup = json_backup
         self.conferences_dir = self.data_dir / "conferences"
         self.papers_dir = self.data_dir / "papers"
+        self.trends_dir = self.data_dir / "trends"
         self.metadata_file = self.data_dir / "metadata.json"
         self.db_file = self.data_dir / "conference_monitor.db"
         
-        # Create directories if they don't exist
-        self.conferences_dir.mkdir(parents=True, exist_ok=True)
-        self.papers_dir.mkdir(parents=True, exist_ok=True)
+        # Parsed file contents keyed by name, each stored with the file stamp it was read at
+        self._file_cache: Dict[str, Tuple[Any, Any]] = {}
+        
+        # Raw JSON of recently read records keyed by (kind, id), each stored
+        # with the stamp it was read at
+        self._record_cache: OrderedDict[Tuple[str, str], Tuple[Any, Any]] = OrderedDict()
+        self._record_cache_lock = threading.Lock()
+        
+        # Connection reused by each thread, see _get_connection
+        self._local = threading.local()
+        
+        # Serializes read-modify-write updates of the metadata file
+        self._metadata_lock = threading.Lock()
+        
+        # Create directories if they don't exist (a single stat each when they do)
+        directories = (self.conferences_dir, self.papers_dir, self.trends_dir) if json_backup else (self.data_dir,)
+        for directory in directories:
+            if not directory.is_dir():
+                directory.mkdir(parents=True, exist_ok=True)
         
         # Initialize metadata if needed
         if not self.metadata_file.exists():
@@ -56,8 +144,8 @@ class AgentMemory:
         Args:
             metadata: Dictionary of metadata to save
         """
-        with open(self.metadata_file, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, indent=2, ensure_ascii=False)
+        with open(self.metadata_file, 'wb') as f:
+            f.write(orjson.dumps(metadata, option=JSON_FILE_OPTIONS))
     
     def load_metadata(self) -> Dict[str, Any]:
         """Load metadata from file
@@ -65,16 +153,134 @@ class AgentMemory:
         Returns:
             Dictionary of metadata
         """
+        # Callers modify the returned metadata before saving it, so hand out a copy
+        return copy.deepcopy(self._cached_metadata())
+    
+    def update_metadata(self, **changes: Any):
+        """Set top-level metadata fields, keeping the others as saved
+        
+        The update is a single locked read-modify-write, so it cannot undo a
+        concurrent update of other fields such as tracked_conferences.
+        
+        Args:
+            **changes: Metadata fields to set
+        """
+        with self._metadata_lock:
+            # Only top-level keys are replaced, so a shallow copy of the cached metadata is enough
+            metadata = dict(self._cached_metadata())
+            metadata.update(changes)
+            self.save_metadata(metadata)
+    
+    def _cached_metadata(self) -> Dict[str, Any]:
+        """Load metadata from file, cached until the file changes
+        
+        Returns:
+            Shared dictionary of metadata, which must not be modified
+        """
         if not self.metadata_file.exists():
             self._initialize_metadata()
         
-        with open(self.metadata_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return self._load_cached(
+            "metadata", self._file_stamp(self.metadata_file), lambda: self._read_json(self.metadata_file)
+        )
+    
+    def _tracked_conference_ids(self) -> frozenset:
+        """Get the IDs of tracked conferences, cached until the metadata file changes
+        
+        Returns:
+            Set of conference IDs
+        """
+        return self._load_cached(
+            "tracked_conferences",
+            self._file_stamp(self.metadata_file),
+            lambda: frozenset(self._cached_metadata()["tracked_conferences"])
+        )
+    
+    @staticmethod
+    def _read_json(path: Any) -> Any:
+        """Read a JSON file in a single read, letting orjson decode the bytes
+        
+        Args:
+            path: Path of the file
+            
+        Returns:
+            Decoded JSON value
+        """
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    
+    @staticmethod
+    def _file_stamp(path: Path) -> Optional[Tuple[int, int]]:
+        """Get a stamp that changes whenever a file is written
+        
+        Args:
+            path: Path of the file
+            
+        Returns:
+            Tuple of modification time and size, or None if the file is missing
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+    
+    def _load_cached(self, key: str, stamp: Any, loader):
+        """Return a cached value, reloading it when its file stamp changed
+        
+        Args:
+            key: Cache entry name
+            stamp: Current stamp of the underlying files
+            loader: Function that loads the value
+            
+        Returns:
+            Cached or freshly loaded value
+        """
+        cached = self._file_cache.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        
+        value = loader()
+        self._file_cache[key] = (stamp, value)
+        return value
+    
+    def connect(self) -> sqlite3.Connection:
+        """Open a connection to the database with the standard pragmas applied
+        
+        Returns:
+            SQLite connection
+        """
+        conn = sqlite3.connect(self.db_file)
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+    
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get the calling thread's connection, opening it on first use
+        
+        Connections are kept per thread since sqlite3 connections may not be
+        shared between threads; each is closed when its thread exits.
+        
+        Returns:
+            SQLite connection
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self.connect()
+            self._local.conn = conn
+        return conn
+    
+    def close(self):
+        """Close the calling thread's connection"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            self._local.conn = None
+            conn.close()
     
     def _initialize_database(self):
         """Initialize the SQLite database with required tables"""
         try:
-            conn = sqlite3.connect(self.db_file)
+            conn = self._get_connection()
             cursor = conn.cursor()
             
             # Create conferences table
@@ -90,11 +296,51 @@ class AgentMemory:
                 location TEXT,
                 source TEXT,
                 research_areas TEXT,
+                tier TEXT,
+                title_norm TEXT,
+                end_epoch INTEGER,
+                updated_at INTEGER,
                 last_updated TEXT,
                 data JSON
             )
             ''')
             
+            # Add columns introduced after the table was first created
+            self._add_missing_columns(cursor, "conferences", {"tier": "TEXT", "title_norm": "TEXT", "end_epoch": "INTEGER", "updated_at": "INTEGER"})
+            cursor.execute("UPDATE conferences SET tier = json_extract(data, '$.tier') WHERE tier IS NULL")
+            cursor.execute("UPDATE conferences SET title_norm = lower(trim(title)) WHERE title_norm IS NULL")
+            cursor.execute('''
+            UPDATE conferences SET end_epoch = CAST(strftime('%s', replace(end_date, 'Z', '')) AS INTEGER)
+            WHERE end_epoch IS NULL AND end_date != ''
+            ''')
+            # Readers of the stored JSON expect end_epoch there too
+            cursor.execute('''
+            UPDATE conferences SET data = json_set(data, '$.end_epoch', end_epoch)
+            WHERE end_epoch IS NOT NULL AND json_type(data, '$.end_epoch') IS NULL
+            ''')
+            cursor.execute('''
+            UPDATE conferences SET updated_at = CAST(strftime('%s', last_updated) AS INTEGER) * 1000
+            WHERE updated_at IS NULL
+            ''')
+            
+            # Indexes for the upcoming-conferences query
+            # (the covering index replaces the old single-column end_date index)
+            cursor.execute("DROP INDEX IF EXISTS idx_conf_enddate")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_conf_covering ON conferences(end_date, start_date, tier, title_norm)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_conf_tier ON conferences(tier)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_conf_start ON conferences(start_date DESC)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_conf_title_norm ON conferences(title_norm)")
+            
+            # Lets MAX(updated_at) for response ETags be read from the index
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_conf_updated_at ON conferences(updated_at)")
+            
+            self._initialize_fts(cursor, "conferences")
+            
+            # Drop the unused per-area lookup table and its triggers from older databases
+            for trigger in ("conf_areas_insert", "conf_areas_delete", "conf_areas_update"):
+                cursor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+            cursor.execute("DROP TABLE IF EXISTS conf_areas")
+            
             # Create papers table
             cursor.execute('''
             CREATE TABLE IF NOT EXISTS papers (
@@ -110,68 +356,333 @@ class AgentMemory:
             )
             ''')
             
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_papers_research_area ON papers(research_area)")
+            
+            self._initialize_fts(cursor, "papers")
+            
+            # Create trends table, newest first for get_latest_trends
+            cursor.execute('''
+            CREATE TABLE IF NOT EXISTS trends (
+                id TEXT PRIMARY KEY,
+                created TEXT,
+                data JSON
+            )
+            ''')
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_trends_created ON trends(created DESC)")
+            
+            self._recover_from_files(cursor)
+            
+            # Create LLM response cache table
+            cursor.execute('''
+            CREATE TABLE IF NOT EXISTS llm_cache (
+                key TEXT PRIMARY KEY,
+                embedding BLOB,
+                response TEXT NOT NULL,
+                created TEXT
+            )
+            ''')
+            
             conn.commit()
-            conn.close()
             logger.info("Database initialized successfully")
         except Exception as e:
             logger.error(f"Error initializing database: {str(e)}")
     
-    def save_conference(self, conference_data: Dict[str, Any]):
+    def _add_missing_columns(self, cursor: sqlite3.Cursor, table: str, columns: Dict[str, str]):
+        """Add columns that are missing from an existing table
+        
+        Args:
+            cursor: Database cursor
+            table: Name of the table
+            columns: Mapping of column name to column type
+        """
+        cursor.execute(f"PRAGMA table_info({table})")
+        existing = {row[1] for row in cursor.fetchall()}
+        
+        for name, column_type in columns.items():
+            if name not in existing:
+                cursor.execute(f"ALTER TABLE {table} ADD COLUMN {name} {column_type}")
+    
+    def _initialize_fts(self, cursor: sqlite3.Cursor, table: str):
+        """Create the full-text index for a table and the triggers keeping it in sync
+        
+        Args:
+            cursor: Database cursor
+            table: Name of the indexed table (see FTS_COLUMNS)
+        """
+        fts_table = f"{table}_fts"
+        columns = FTS_COLUMNS[table]
+        column_list = ", ".join(columns)
+        new_values = ", ".join(f"new.{c}" for c in columns)
+        old_values = ", ".join(f"old.{c}" for c in columns)
+        
+        create_sql = (
+            f"CREATE VIRTUAL TABLE {fts_table} USING fts5({column_list}, "
+            f"content='{table}', content_rowid='rowid', tokenize='porter unicode61')"
+        )
+        
+        cursor.execute("SELECT sql FROM sqlite_master WHERE name = ?", (fts_table,))
+        row = cursor.fetchone()
+        
+        if row and row[0] == create_sql:
+            return
+        
+        # Missing or outdated definition: recreate and index the existing rows
+        for suffix in ("insert", "delete", "update"):
+            cursor.execute(f"DROP TRIGGER IF EXISTS {fts_table}_{suffix}")
+        cursor.execute(f"DROP TABLE IF EXISTS {fts_table}")
+        cursor.execute(create_sql)
+        cursor.execute(f"INSERT INTO {fts_table}({fts_table}) VALUES ('rebuild')")
+        
+        cursor.execute(f'''
+        CREATE TRIGGER {fts_table}_insert AFTER INSERT ON {table} BEGIN
+            INSERT INTO {fts_table}(rowid, {column_list}) VALUES (new.rowid, {new_values});
+        END
+        ''')
+        cursor.execute(f'''
+        CREATE TRIGGER {fts_table}_delete AFTER DELETE ON {table} BEGIN
+            INSERT INTO {fts_table}({fts_table}, rowid, {column_list}) VALUES ('delete', old.rowid, {old_values});
+        END
+        ''')
+        cursor.execute(f'''
+        CREATE TRIGGER {fts_table}_update AFTER UPDATE ON {table} BEGIN
+            INSERT INTO {fts_table}({fts_table}, rowid, {column_list}) VALUES ('delete', old.rowid, {old_values});
+            INSERT INTO {fts_table}(rowid, {column_list}) VALUES (new.rowid, {new_values});
+        END
+        ''')
+    
+    def _recover_from_files(self, cursor: sqlite3.Cursor):
+        """Load conferences, papers and trends from their JSON files into empty tables
+        
+        This recovers data written only to files, by older versions or before
+        the database was lost; afterwards the database alone is read.
+        
+        Args:
+            cursor: Database cursor
+        """
+        updated_at = time.time_ns() // 1_000_000
+        sources = (
+            ("conferences", self.conferences_dir, CONFERENCE_INSERT_SQL,
+             lambda data: self._conference_row(data, updated_at)),
+            ("papers", self.papers_dir, PAPER_INSERT_SQL, self._paper_row),
+            ("trends", self.trends_dir, TREND_INSERT_SQL, self._trend_row),
+        )
+        
+        for table, directory, insert_sql, build_row in sources:
+            cursor.execute(f"SELECT 1 FROM {table} LIMIT 1")
+            if cursor.fetchone():
+                continue
+            
+            for file_path in self._json_file_paths(directory):
+                try:
+                    data = self._read_json(file_path)
+                    if "id" in data:
+                        cursor.execute(insert_sql, build_row(data))
+                except Exception as e:
+                    logger.warning(f"Skipping {table} file {file_path}: {str(e)}")
+    
+    @staticmethod
+    def _json_file_paths(directory: Path) -> Iterator[str]:
+        """Iterate over the JSON files in a directory
+        
+        Uses os.scandir, whose entries carry the name and file type read with
+        the directory listing, so no file is stat'ed on its own.
+        
+        Args:
+            directory: Directory to list
+            
+        Yields:
+            Paths of the JSON files, nothing if the directory does not exist
+        """
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.json') and entry.is_file(follow_symlinks=False):
+                        yield entry.path
+        except FileNotFoundError:
+            return
+    
+    def export_to_files(self) -> int:
+        """Write every conference, paper and trend to its own JSON file
+        
+        Returns:
+            Number of files written
+        """
+        count = 0
+        for directory, records in ((self.conferences_dir, self.iter_conferences()),
+                                   (self.papers_dir, self.iter_papers()),
+                                   (self.trends_dir, self.iter_latest_trends(limit=-1))):
+            directory.mkdir(parents=True, exist_ok=True)
+            for record in records:
+                with open(self._record_path(directory, record['id']), 'wb') as f:
+                    f.write(orjson.dumps(record, option=JSON_FILE_OPTIONS))
+                count += 1
+        
+        logger.info(f"Exported {count} records to {self.data_dir}")
+        return count
+    
+    @staticmethod
+    def _record_path(directory: Path, record_id: str) -> Path:
+        """Get the JSON file path of a record
+        
+        Args:
+            directory: Directory of the record type
+            record_id: ID of the record
+            
+        Returns:
+            Path of the record's JSON file
+        """
+        return directory / f"{UNSAFE_FILENAME_PATTERN.sub('_', record_id)}.json"
+    
+    @staticmethod
+    def _as_record(record: Union[Dict[str, Any], BaseModel]) -> Dict[str, Any]:
+        """Get the dictionary stored for a record
+        
+        Args:
+            record: Record dictionary or model instance
+            
+        Returns:
+            The dictionary itself, or the model dumped to JSON-compatible values
+        """
+        if isinstance(record, BaseModel):
+            return record.model_dump(mode="json")
+        return record
+    
+    def save_conference(self, conference_data: Union[Dict[str, Any], Conference]):
         """Save conference data to memory
         
         Args:
-            conference_data: Dictionary containing conference information
+            conference_data: Dictionary or Conference model containing conference information
         """
-        if "id" not in conference_data:
+        self.save_conferences_bulk([conference_data])
+    
+    def save_conferences_bulk(self, conferences: List[Union[Dict[str, Any], Conference]], *,
+                              now: Optional[datetime] = None) -> int:
+        """Save several conferences in a single database transaction
+        
+        If the batch fails, conferences are saved one at a time so a single
+        bad record does not lose the rest.
+        
+        Args:
+            conferences: List of conference data dictionaries or Conference models
+            now: Update time recorded for the batch, so a refresh can stamp all
+                its conferences alike (defaults to the current time)
+            
+        Returns:
+            Number of conferences saved to the database
+        """
+        conferences = [self._as_record(conference_data) for conference_data in conferences]
+        
+        if any("id" not in conference_data for conference_data in conferences):
             raise ValueError("Conference data must include an 'id' field")
         
-        conference_id = conference_data["id"]
+        if not conferences:
+            return 0
         
-        # Add timestamp for tracking
-        conference_data["_last_updated"] = datetime.now().isoformat()
+        # Add timestamp for tracking. updated_at always takes the current time
+        # since it versions the data for response ETags.
+        last_updated = (now or datetime.now()).isoformat()
+        updated_at = time.time_ns() // 1_000_000
         
-        # Save to file system (for backward compatibility)
-        file_path = self.conferences_dir / f"{conference_id}.json"
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(conference_data, f, indent=2, ensure_ascii=False)
+        for conference_data in conferences:
+            conference_data["_last_updated"] = last_updated
+            
+            # Store the end date as an epoch so filters can compare integers
+            conference_data["end_epoch"] = self._end_epoch(conference_data.get('end_date'))
+            
+            # Save to file system (for backward compatibility)
+            if self.json_backup:
+                file_path = self._record_path(self.conferences_dir, conference_data['id'])
+                with open(file_path, 'wb') as f:
+                    f.write(orjson.dumps(conference_data, option=JSON_FILE_OPTIONS))
         
         # Save to database
         try:
-            conn = sqlite3.connect(self.db_file)
-            cursor = conn.cursor()
-            
-            # Extract main fields for efficient querying
-            title = conference_data.get('title', '')
-            url = conference_data.get('url', '')
-            description = conference_data.get('description', '')
-            dates = conference_data.get('dates', '')
-            start_date = conference_data.get('start_date', '')
-            end_date = conference_data.get('end_date', '')
-            location = conference_data.get('location', '')
-            source = conference_data.get('source', '')
-            research_areas = ','.join(conference_data.get('research_areas', []))
-            last_updated = conference_data.get('_last_updated', datetime.now().isoformat())
-            
-            # Store full data as JSON
-            data_json = json.dumps(conference_data, ensure_ascii=False)
-            
-            # Insert or replace existing record
-            cursor.execute('''
-            INSERT OR REPLACE INTO conferences
-            (id, title, url, description, dates, start_date, end_date, location, source, research_areas, last_updated, data)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (conference_id, title, url, description, dates, start_date, end_date, location, source, research_areas, last_updated, data_json))
+            conn = self._get_connection()
+            with conn:
+                conn.executemany(CONFERENCE_INSERT_SQL, [self._conference_row(c, updated_at) for c in conferences])
+            saved = conferences
+        except Exception as e:
+            logger.error(f"Error saving conferences to database, saving them one at a time: {str(e)}")
+            saved = [c for c in conferences if self._save_conference_row(c, updated_at)]
+        
+        # Update metadata, rewriting it only when new conferences are tracked
+        with self._metadata_lock:
+            tracked = self._tracked_conference_ids()
+            new_ids = list(dict.fromkeys(c["id"] for c in saved if c["id"] not in tracked))
+            if new_ids:
+                metadata = self.load_metadata()
+                metadata["tracked_conferences"].extend(new_ids)
+                self.save_metadata(metadata)
+        
+        return len(saved)
+    
+    def _save_conference_row(self, conference_data: Dict[str, Any], updated_at: int) -> bool:
+        """Save one conference to the database in its own transaction
+        
+        Args:
+            conference_data: Dictionary containing conference information
+            updated_at: Write time in milliseconds since the epoch
             
-            conn.commit()
-            conn.close()
+        Returns:
+            Whether the conference was saved
+        """
+        try:
+            conn = self._get_connection()
+            with conn:
+                conn.execute(CONFERENCE_INSERT_SQL, self._conference_row(conference_data, updated_at))
+            return True
         except Exception as e:
-            logger.error(f"Error saving conference to database: {str(e)}")
+            logger.error(f"Error saving conference {conference_data['id']} to database: {str(e)}")
+            return False
+    
+    def _conference_row(self, conference_data: Dict[str, Any], updated_at: int) -> tuple:
+        """Build the conferences table row for a conference
         
-        # Update metadata
-        metadata = self.load_metadata()
-        if conference_id not in metadata["tracked_conferences"]:
-            metadata["tracked_conferences"].append(conference_id)
-            self.save_metadata(metadata)
+        Args:
+            conference_data: Dictionary containing conference information
+            updated_at: Write time in milliseconds since the epoch
+            
+        Returns:
+            Tuple of column values matching CONFERENCE_INSERT_SQL
+        """
+        title = conference_data.get('title') or ''
+        values = {**CONFERENCE_COLUMN_DEFAULTS, **conference_data}
+        
+        return (
+            conference_data["id"],
+            title,
+            *CONFERENCE_COLUMN_GETTER(values),
+            ','.join(conference_data.get('research_areas') or []),
+            values['tier'],
+            title.strip().lower(),
+            values['end_epoch'],
+            updated_at,
+            conference_data.get('_last_updated') or datetime.now().isoformat(),
+            orjson.dumps(conference_data, option=orjson.OPT_NON_STR_KEYS).decode()
+        )
+    
+    @staticmethod
+    def _end_epoch(end_date: Optional[str]) -> Optional[int]:
+        """Convert an ISO end date to a Unix timestamp
+        
+        Args:
+            end_date: ISO 8601 date or datetime; naive values are taken as UTC
+            
+        Returns:
+            Timestamp in seconds, or None if the date is missing or invalid
+        """
+        if not end_date:
+            return None
+        
+        try:
+            parsed = datetime.fromisoformat(end_date.replace('Z', '+00:00'))
+        except (ValueError, TypeError):
+            return None
+        
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        
+        return int(parsed.timestamp())
     
     def get_conference(self, conference_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve conference data by ID
@@ -182,29 +693,66 @@ class AgentMemory:
         Returns:
             Conference data dictionary or None if not found
         """
-        # Try to get from database first
+        data = self._get_record_json(
+            "conference", conference_id, self._db_stamp(), self._read_conference_json
+        )
+        return orjson.loads(data) if data is not None else None
+    
+    def _read_conference_json(self, conference_id: str) -> Optional[Any]:
+        """Read the stored JSON of a conference
+        
+        Args:
+            conference_id: ID of the conference to read
+            
+        Returns:
+            JSON text or bytes, or None if not found
+        """
         try:
-            conn = sqlite3.connect(self.db_file)
+            conn = self._get_connection()
             cursor = conn.cursor()
             
             cursor.execute("SELECT data FROM conferences WHERE id = ?", (conference_id,))
             result = cursor.fetchone()
             
-            conn.close()
-            
             if result and result[0]:
-                return json.loads(result[0])
+                return result[0]
         except Exception as e:
             logger.error(f"Error retrieving conference from database: {str(e)}")
         
-        # Fall back to file system
-        file_path = self.conferences_dir / f"{conference_id}.json"
+        return None
+    
+    def _get_record_json(self, kind: str, record_id: str, stamp: Any, reader) -> Optional[Any]:
+        """Return a record's JSON from the record cache, reading it on a miss
+        
+        Entries read before the stamp last changed are read again, and the
+        least recently used entries are dropped beyond RECORD_CACHE_SIZE.
         
-        if not file_path.exists():
+        Args:
+            kind: Record type, part of the cache key
+            record_id: ID of the record
+            stamp: Current stamp of the underlying files
+            reader: Function reading the record's JSON by ID
+            
+        Returns:
+            JSON text or bytes, or None if the record does not exist
+        """
+        key = (kind, record_id)
+        with self._record_cache_lock:
+            cached = self._record_cache.get(key)
+            if cached is not None and cached[0] == stamp:
+                self._record_cache.move_to_end(key)
+                return cached[1]
+        
+        data = reader(record_id)
+        if data is None:
             return None
         
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with self._record_cache_lock:
+            self._record_cache[key] = (stamp, data)
+            self._record_cache.move_to_end(key)
+            while len(self._record_cache) > RECORD_CACHE_SIZE:
+                self._record_cache.popitem(last=False)
+        return data
     
     def list_conferences(self) -> List[Dict[str, Any]]:
         """List all tracked conferences
@@ -212,60 +760,175 @@ class AgentMemory:
         Returns:
             List of conference data dictionaries
         """
-        # Try to get from database first
-        try:
-            conn = sqlite3.connect(self.db_file)
-            cursor = conn.cursor()
-            
-            # Get conferences, focusing on upcoming ones
-            cursor.execute('''
-            SELECT data FROM conferences 
-            ORDER BY start_date DESC
-            ''')
-            
-            results = cursor.fetchall()
-            conn.close()
+        return list(self.iter_conferences())
+    
+    def iter_conferences(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over all tracked conferences, decoding them one at a time
+        
+        Yields:
+            Conference data dictionaries
+        """
+        rows = self._query_json_rows("conferences", "SELECT data FROM conferences ORDER BY start_date DESC",
+                                     allow_empty=True)
+        if rows is not None:
+            yield from rows
+    
+    def _query_json_rows(self, kind: str, query: str, params: tuple = (),
+                         allow_empty: bool = False) -> Optional[Iterator[Dict[str, Any]]]:
+        """Run a query selecting a JSON data column and decode rows lazily
+        
+        The query runs immediately, so errors are logged before anything is
+        yielded.
+        
+        Args:
+            kind: Name of the records, for error messages
+            query: SQL query whose first column holds JSON
+            params: Query parameters
+            allow_empty: Whether a query returning no rows counts as a result
             
-            if results:
-                conferences = [json.loads(row[0]) for row in results]
-                return conferences
+        Returns:
+            Iterator over decoded rows, or None if the query failed (or returned
+            no rows and allow_empty is False)
+        """
+        try:
+            cursor = self._get_connection().execute(query, params)
+            first = cursor.fetchone()
         except Exception as e:
-            logger.error(f"Error listing conferences from database: {str(e)}")
+            logger.error(f"Error listing {kind} from database: {str(e)}")
+            return None
         
-        # Fall back to file system
-        conferences = []
+        if first is None and not allow_empty:
+            cursor.close()
+            return None
         
-        for file_path in self.conferences_dir.glob("*.json"):
-            with open(file_path, 'r', encoding='utf-8') as f:
-                conferences.append(json.load(f))
+        def rows():
+            if first is not None:
+                yield orjson.loads(first[0])
+            for row in cursor:
+                yield orjson.loads(row[0])
         
-        return conferences
+        return rows()
     
     def load_conferences(self) -> List[Dict[str, Any]]:
         """Load all tracked conferences
         
+        The list is cached until the database changes, so callers must not
+        modify it.
+        
         Returns:
             List of conference data dictionaries
         """
-        return self.list_conferences()
+        return self._load_cached("conferences", self._db_stamp(), self.list_conferences)
     
-    def save_paper(self, paper_data: Dict[str, Any]):
+    def _db_stamp(self) -> Tuple[Any, ...]:
+        """Get a stamp that changes whenever the database is written
+        
+        Returns:
+            File stamps of the database and its WAL file
+        """
+        return (
+            self._file_stamp(self.db_file),
+            self._file_stamp(Path(f"{self.db_file}-wal"))
+        )
+    
+    def load_conference_search_entries(self) -> List[Tuple[Dict[str, Any], str, str]]:
+        """Load all tracked conferences with their lowercased text for filtering
+        
+        Like load_conferences, the result is cached until the underlying files
+        change, so lowercasing happens once per load rather than per request.
+        
+        Returns:
+            List of (conference, normalized title, lowercased description,
+            title and research areas) tuples, ordered by start date
+        """
+        def build_entries():
+            entries = [
+                (
+                    conf,
+                    conf.get('title', '').strip().lower(),
+                    "\n".join((
+                        conf.get('description', ''),
+                        conf.get('title', ''),
+                        ', '.join(conf.get('research_areas', []))
+                    )).lower()
+                )
+                for conf in self.load_conferences()
+            ]
+            # Chronological order, with undated conferences last
+            entries.sort(key=lambda entry: entry[0].get('start_date') or '9999-12-31')
+            return entries
+        
+        return self._load_cached("conference_search_entries", self._db_stamp(), build_entries)
+    
+    def save_paper(self, paper_data: Union[Dict[str, Any], Paper]):
         """Save paper data to memory
         
         Args:
-            paper_data: Dictionary containing paper information
+            paper_data: Dictionary or Paper model containing paper information
         """
-        if "id" not in paper_data:
+        self.save_papers_bulk([paper_data])
+    
+    def save_papers_bulk(self, papers: List[Union[Dict[str, Any], Paper]], *, now: Optional[datetime] = None):
+        """Save several papers in a single database transaction
+        
+        Args:
+            papers: List of paper data dictionaries or Paper models
+            now: Update time shared by the batch (defaults to the current time)
+        """
+        papers = [self._as_record(paper_data) for paper_data in papers]
+        
+        if any("id" not in paper_data for paper_data in papers):
             raise ValueError("Paper data must include an 'id' field")
         
-        paper_id = paper_data["id"]
-        file_path = self.papers_dir / f"{paper_id}.json"
+        if not papers:
+            return
         
         # Add timestamp for tracking
-        paper_data["_last_updated"] = datetime.now().isoformat()
+        last_updated = (now or datetime.now()).isoformat()
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(paper_data, f, indent=2, ensure_ascii=False)
+        for paper_data in papers:
+            paper_data["_last_updated"] = last_updated
+            
+            if self.json_backup:
+                file_path = self._record_path(self.papers_dir, paper_data['id'])
+                with open(file_path, 'wb') as f:
+                    f.write(orjson.dumps(paper_data, option=JSON_FILE_OPTIONS))
+        
+        # Save to database
+        try:
+            conn = self._get_connection()
+            with conn:
+                conn.executemany(PAPER_INSERT_SQL, (self._paper_row(p) for p in papers))
+        except Exception as e:
+            logger.error(f"Error saving papers to database: {str(e)}")
+    
+    def _paper_row(self, paper_data: Dict[str, Any]) -> tuple:
+        """Build the papers table row for a paper
+        
+        Args:
+            paper_data: Dictionary containing paper information
+            
+        Returns:
+            Tuple of column values matching PAPER_INSERT_SQL
+        """
+        paper_id, title, url, authors, abstract, year, research_area = PAPER_COLUMN_GETTER(
+            {**PAPER_COLUMN_DEFAULTS, **paper_data}
+        )
+        if isinstance(authors, list):
+            # Authors of dumped Paper models are dictionaries
+            authors = ', '.join(a.get('name', '') if isinstance(a, dict) else str(a) for a in authors)
+        
+        return (
+            paper_id,
+            title,
+            url,
+            authors,
+            abstract,
+            str(year),
+            research_area,
+            paper_data.get('_last_updated') or datetime.now().isoformat(),
+            orjson.dumps(paper_data, option=orjson.OPT_NON_STR_KEYS).decode()
+        )
     
     def get_paper(self, paper_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve paper data by ID
@@ -276,13 +939,28 @@ class AgentMemory:
         Returns:
             Paper data dictionary or None if not found
         """
-        file_path = self.papers_dir / f"{paper_id}.json"
+        data = self._get_record_json("paper", paper_id, self._db_stamp(), self._read_paper_json)
+        return orjson.loads(data) if data is not None else None
+    
+    def _read_paper_json(self, paper_id: str) -> Optional[Any]:
+        """Read the stored JSON of a paper
         
-        if not file_path.exists():
-            return None
+        Args:
+            paper_id: ID of the paper to read
+            
+        Returns:
+            JSON text or bytes, or None if not found
+        """
+        try:
+            conn = self._get_connection()
+            result = conn.execute("SELECT data FROM papers WHERE id = ?", (paper_id,)).fetchone()
+            
+            if result and result[0]:
+                return result[0]
+        except Exception as e:
+            logger.error(f"Error retrieving paper from database: {str(e)}")
         
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return None
     
     def list_papers(self, filter_dict: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """List papers, optionally filtered by properties
@@ -293,37 +971,86 @@ class AgentMemory:
         Returns:
             List of paper data dictionaries
         """
-        papers = []
-        
-        for file_path in self.papers_dir.glob("*.json"):
-            with open(file_path, 'r', encoding='utf-8') as f:
-                paper = json.load(f)
-                
-                # Apply filter if provided
-                if filter_dict:
-                    matches = True
-                    for key, value in filter_dict.items():
-                        if key not in paper or paper[key] != value:
-                            matches = False
-                            break
-                    
-                    if not matches:
-                        continue
-                
-                papers.append(paper)
-        
-        return papers
+        return list(self.iter_papers(filter_dict))
+    
+    def iter_papers(self, filter_dict: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """Iterate over papers, optionally filtered by properties, decoding them one at a time
+        
+        Args:
+            filter_dict: Dictionary of key-value pairs to filter papers by
+            
+        Yields:
+            Paper data dictionaries
+        """
+        matches = self._filter_predicate(filter_dict) if filter_dict else None
+        
+        # Let SQL apply the filters it can: indexed columns where they hold the
+        # same value as the JSON, json_extract for other scalar values. The
+        # predicate still checks every filter, keeping Python equality semantics.
+        conditions = []
+        params = []
+        for key, value in (filter_dict or {}).items():
+            if key in PAPER_FILTER_COLUMNS and isinstance(value, str):
+                conditions.append(f"{key} = ?")
+                params.append(value)
+            elif isinstance(value, (str, int, float)) and '"' not in key:
+                conditions.append("json_extract(data, ?) = ?")
+                params.extend((f'$."{key}"', value))
+        
+        query = "SELECT data FROM papers"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        
+        papers = self._query_json_rows("papers", query, tuple(params), allow_empty=True)
+        if papers is None:
+            return
+        
+        yield from filter(matches, papers) if matches else papers
     
     def load_papers(self, filter_dict: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """Load papers, optionally filtered by properties
         
+        All papers are read once and cached until the database changes, so
+        callers must not modify the returned papers.
+        
         Args:
             filter_dict: Dictionary of key-value pairs to filter papers by
             
         Returns:
             List of paper data dictionaries
         """
-        return self.list_papers(filter_dict)
+        papers = self._load_cached("papers", self._db_stamp(), self.list_papers)
+        
+        if not filter_dict:
+            return list(papers)
+        
+        return list(filter(self._filter_predicate(filter_dict), papers))
+    
+    @staticmethod
+    def _filter_predicate(filter_dict: Dict[str, Any]) -> Callable[[Dict[str, Any]], bool]:
+        """Build a check for whether a paper has all the given property values
+        
+        The keys are looked up with a single itemgetter call per paper and
+        compared to the expected values in one tuple comparison.
+        
+        Args:
+            filter_dict: Non-empty dictionary of key-value pairs to match
+            
+        Returns:
+            Function returning True if every key is present with an equal value
+        """
+        getter = operator.itemgetter(*filter_dict)
+        expected = tuple(filter_dict.values())
+        if len(expected) == 1:
+            expected = expected[0]
+        
+        def matches(paper: Dict[str, Any]) -> bool:
+            try:
+                return getter(paper) == expected
+            except KeyError:
+                return False
+        
+        return matches
     
     def save_trend(self, trend_data: Dict[str, Any]):
         """Save trend data to memory
@@ -331,18 +1058,45 @@ class AgentMemory:
         Args:
             trend_data: Dictionary containing trend information
         """
+        now = datetime.now()
+        
         if "id" not in trend_data:
             # Use timestamp as ID if not provided
-            trend_data["id"] = f"trend_{datetime.now().strftime('%Y%m%d%H%M%S')}"
+            trend_data["id"] = f"trend_{now.strftime('%Y%m%d%H%M%S')}"
         
         trend_id = trend_data["id"]
-        file_path = self.trends_dir / f"{trend_id}.json"
         
         # Add timestamp
-        trend_data["_created"] = datetime.now().isoformat()
+        trend_data["_created"] = now.isoformat()
+        
+        # Save to database
+        try:
+            conn = self._get_connection()
+            with conn:
+                conn.execute(TREND_INSERT_SQL, self._trend_row(trend_data))
+        except Exception as e:
+            logger.error(f"Error saving trend to database: {str(e)}")
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(trend_data, f, indent=2, ensure_ascii=False)
+        if self.json_backup:
+            file_path = self._record_path(self.trends_dir, trend_id)
+            with open(file_path, 'wb') as f:
+                f.write(orjson.dumps(trend_data, option=JSON_FILE_OPTIONS))
+    
+    @staticmethod
+    def _trend_row(trend_data: Dict[str, Any]) -> tuple:
+        """Build the trends table row for a trend
+        
+        Args:
+            trend_data: Dictionary containing trend information
+            
+        Returns:
+            Tuple of column values matching TREND_INSERT_SQL
+        """
+        return (
+            trend_data["id"],
+            trend_data.get("_created", ""),
+            orjson.dumps(trend_data, option=orjson.OPT_NON_STR_KEYS).decode()
+        )
     
     def get_latest_trends(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get latest trend reports
@@ -353,13 +1107,67 @@ class AgentMemory:
         Returns:
             List of trend data dictionaries, sorted by date (newest first)
         """
-        trends = []
+        return list(self.iter_latest_trends(limit))
+    
+    def iter_latest_trends(self, limit: int = 10) -> Iterator[Dict[str, Any]]:
+        """Iterate over the latest trend reports, decoding them one at a time
+        
+        Args:
+            limit: Maximum number of trends to return (negative for all)
+            
+        Yields:
+            Trend data dictionaries, newest first
+        """
+        rows = self._query_json_rows("trends", "SELECT data FROM trends ORDER BY created DESC LIMIT ?", (limit,),
+                                     allow_empty=True)
+        if rows is not None:
+            yield from rows
+    
+    def get_cached_response(self, key: str) -> Optional[str]:
+        """Retrieve a cached LLM response
         
-        for file_path in self.trends_dir.glob("*.json"):
-            with open(file_path, 'r', encoding='utf-8') as f:
-                trends.append(json.load(f))
+        Args:
+            key: Cache key of the prompt
+            
+        Returns:
+            Cached response or None if not found
+        """
+        try:
+            conn = self._get_connection()
+            row = conn.execute("SELECT response FROM llm_cache WHERE key = ?", (key,)).fetchone()
+            return row[0] if row else None
+        except Exception as e:
+            logger.error(f"Error reading LLM cache: {str(e)}")
+            return None
+    
+    def save_cached_response(self, key: str, response: str, embedding: Optional[bytes] = None):
+        """Store an LLM response in the cache
         
-        # Sort by date (newest first)
-        trends.sort(key=lambda x: x.get("_created", ""), reverse=True)
+        Args:
+            key: Cache key of the prompt
+            response: LLM response
+            embedding: Prompt embedding as raw float32 bytes
+        """
+        try:
+            conn = self._get_connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, embedding, response, created) VALUES (?, ?, ?, ?)",
+                (key, embedding, response, datetime.now().isoformat())
+            )
+            conn.commit()
+        except Exception as e:
+            logger.error(f"Error writing LLM cache: {str(e)}")
+    
+    def list_cached_embeddings(self) -> List[Tuple[str, bytes]]:
+        """List the prompt embeddings stored in the LLM cache
         
-        return trends[:limit] 
\ No newline at end of file
+        Returns:
+            List of (key, embedding bytes) tuples
+        """
+        try:
+            conn = self._get_connection()
+            rows = conn.execute("SELECT key, embedding FROM llm_cache WHERE embedding IS NOT NULL").fetchall()
+            return rows
+        except Exception as e:
+            logger.error(f"Error reading LLM cache embeddings: {str(e)}")
+            return []
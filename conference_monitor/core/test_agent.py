@@ -0,0 +1,38 @@
+"""
+Tests for the batch paper analysis prompt helpers
+"""
+from conference_monitor.core.agent import ConferenceAgent, PAPERS_BATCH_INSTRUCTIONS
+
+
+def test_papers_batch_query_numbers_papers_from_one():
+    """Each paper is listed under its 1-based index after the instructions"""
+    query = ConferenceAgent._papers_batch_query([
+        {"title": "First", "abstract": "Abstract one"},
+        {"title": "Second", "abstract": "Abstract two"}
+    ])
+    
+    assert query.startswith(PAPERS_BATCH_INSTRUCTIONS)
+    assert "[1] Title: First\nAbstract: Abstract one" in query
+    assert "[2] Title: Second\nAbstract: Abstract two" in query
+
+
+def test_parse_batch_analyses_strips_code_fence():
+    """A JSON array wrapped in a markdown code fence is parsed"""
+    response = '```json\n[{"index": 1, "area": "NLP"}, {"index": 2, "area": "Vision"}]\n```'
+    
+    parsed = ConferenceAgent._parse_batch_analyses(response, 2)
+    
+    assert parsed == {1: {"index": 1, "area": "NLP"}, 2: {"index": 2, "area": "Vision"}}
+
+
+def test_parse_batch_analyses_skips_bad_indices():
+    """Items with a missing, non-integer or out-of-range index are dropped"""
+    response = '[{"index": 0}, {"index": 3}, {"index": "2"}, {"area": "NLP"}, "text", {"index": 2}]'
+    
+    assert ConferenceAgent._parse_batch_analyses(response, 2) == {2: {"index": 2}}
+
+
+def test_parse_batch_analyses_rejects_non_list_responses():
+    """Responses that are not a JSON array yield no analyses"""
+    assert ConferenceAgent._parse_batch_analyses('{"index": 1}', 1) == {}
+    assert ConferenceAgent._parse_batch_analyses("Error processing query: rate limited", 1) == {}
@@ -5,6 +5,7 @@ import argparse
 import sys
 import os
 import logging
+from logging.handlers import RotatingFileHandler
 import time
 from typing import List, Optional
 
@@ -13,16 +14,18 @@ from conference_monitor.core.memory import AgentMemory
 from conference_monitor.core.browser import BrowserManager
 from conference_monitor.services.monitor_service import MonitorService
 from conference_monitor.services.report_service import ReportService
-from conference_monitor.config import DEFAULT_RESEARCH_AREAS
+from conference_monitor.config import DEFAULT_RESEARCH_AREAS, LOG_MAX_BYTES, LOG_BACKUP_COUNT
 
-# Set up logging
+# Set up logging, replacing the handlers installed when the modules above were imported.
+# The log file is rotated so long-running monitors don't grow it without bound.
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
         logging.StreamHandler(sys.stdout),
-        logging.FileHandler('conference_monitor.log')
-    ]
+        RotatingFileHandler('conference_monitor.log', maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT)
+    ],
+    force=True
 )
 
 logger = logging.getLogger(__name__)
@@ -107,6 +110,9 @@ def run_monitor(research_areas: Optional[List[str]] = None, run_once: bool = Fal
         except KeyboardInterrupt:
             logger.info("Stopping monitoring due to keyboard interrupt")
             monitor_service.stop_monitoring()
+    
+    monitor_service.close()
+    browser.close()
 
 def run_api(port: int = 5000):
     """Run the Flask API server
@@ -3,7 +3,8 @@ Conference data model
 """
 from typing import List, Optional, Dict, Any
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic.main import BaseModel
+from pydantic.fields import Field
 
 
 class ConferenceDeadline(BaseModel):
@@ -31,16 +32,20 @@ class Conference(BaseModel):
     source: Optional[str] = Field(None, description="Source of the conference data")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
     
-    def is_upcoming(self) -> bool:
+    def is_upcoming(self, now: Optional[datetime] = None) -> bool:
         """Check if the conference is upcoming
         
+        Args:
+            now: Current time, so callers checking many conferences can read
+                the clock once (defaults to datetime.now())
+        
         Returns:
             True if the conference end date is in the future, False otherwise
         """
         if not self.end_date:
             return True  # Assume upcoming if no end date
         
-        return self.end_date > datetime.now()
+        return self.end_date > (now or datetime.now())
     
     def get_nearest_deadline(self) -> Optional[ConferenceDeadline]:
         """Get the nearest upcoming deadline
@@ -53,14 +58,12 @@ class Conference(BaseModel):
         if not upcoming_deadlines:
             return None
         
-        # Sort by date (this assumes timestamps are properly parsed)
+        # Earliest by timestamp (this assumes timestamps are properly parsed)
         # Fall back to string comparison if timestamps aren't available
         if all(d.timestamp for d in upcoming_deadlines):
-            sorted_deadlines = sorted(upcoming_deadlines, key=lambda d: d.timestamp)
-        else:
-            sorted_deadlines = sorted(upcoming_deadlines, key=lambda d: d.date)
+            return min(upcoming_deadlines, key=lambda d: d.timestamp)
         
-        return sorted_deadlines[0]
+        return min(upcoming_deadlines, key=lambda d: d.date)
     
 
 class ConferenceList(BaseModel):
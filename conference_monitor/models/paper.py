@@ -3,7 +3,8 @@ Paper data model
 """
 from typing import List, Optional, Dict, Any
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic.main import BaseModel
+from pydantic.fields import Field
 
 
 class Author(BaseModel):
@@ -0,0 +1,41 @@
+"""
+Tests for the trend data models
+"""
+from datetime import datetime
+
+import pytest
+from pydantic import ValidationError
+
+from conference_monitor.models.trend import Topic, Trend, TrendReport
+
+
+def sample_report_data():
+    """Build report data as a validated report would dump it"""
+    return TrendReport(
+        id="report_1",
+        title="Machine learning trends",
+        research_area="machine learning",
+        generated_date=datetime(2024, 1, 1),
+        trends=[
+            Trend(
+                id="trend_1",
+                name="Diffusion models",
+                research_area="machine learning",
+                topics=[Topic(name="Image generation", keywords=["diffusion"])],
+                evidence_papers=[{"id": "paper_1", "title": "A paper", "authors": [{"name": "Smith"}]}],
+                popularity_score=0.9,
+                created_date=datetime(2024, 1, 1),
+                last_updated=datetime(2024, 1, 1)
+            )
+        ]
+    ).model_dump()
+
+
+def test_models_are_frozen():
+    """Trend models reject attribute assignment, including nested ones"""
+    report = TrendReport(**sample_report_data())
+    
+    with pytest.raises(ValidationError):
+        report.title = "Changed"
+    with pytest.raises(ValidationError):
+        report.trends[0].topics[0].name = "Changed"
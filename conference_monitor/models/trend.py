@@ -3,13 +3,18 @@ Trend data model
 """
 from typing import List, Optional, Dict, Any
 from datetime import datetime
-from pydantic import BaseModel, Field
+import heapq
+from pydantic.config import ConfigDict
+from pydantic.main import BaseModel
+from pydantic.fields import Field
 
 from conference_monitor.models.paper import Paper
 
 
 class Topic(BaseModel):
     """Research topic model"""
+    model_config = ConfigDict(frozen=True)
+    
     name: str = Field(..., description="Name of the topic")
     description: Optional[str] = Field(None, description="Description of the topic")
     relevance_score: Optional[float] = Field(None, description="Relevance score (0-1)")
@@ -19,6 +24,8 @@ class Topic(BaseModel):
 
 class Trend(BaseModel):
     """Trend data model"""
+    model_config = ConfigDict(frozen=True)
+    
     id: str = Field(..., description="Unique identifier for the trend")
     name: str = Field(..., description="Name of the trend")
     description: Optional[str] = Field(None, description="Description of the trend")
@@ -34,6 +41,8 @@ class Trend(BaseModel):
 
 class TrendReport(BaseModel):
     """Trend report model"""
+    model_config = ConfigDict(frozen=True)
+    
     id: str = Field(..., description="Unique identifier for the report")
     title: str = Field(..., description="Title of the report")
     research_area: str = Field(..., description="Research area the report covers")
@@ -53,12 +62,8 @@ class TrendReport(BaseModel):
         Returns:
             List of top trends
         """
-        sorted_trends = sorted(
-            self.trends, 
-            key=lambda t: t.popularity_score or 0, 
-            reverse=True
-        )
-        return sorted_trends[:limit]
+        # Same order as a full descending sort, in O(n log limit)
+        return heapq.nlargest(limit, self.trends, key=lambda t: t.popularity_score or 0)
     
     def get_fastest_growing_trends(self, limit: int = 5) -> List[Trend]:
         """Get fastest growing trends by growth rate
@@ -69,9 +74,4 @@ class TrendReport(BaseModel):
         Returns:
             List of fastest growing trends
         """
-        sorted_trends = sorted(
-            self.trends, 
-            key=lambda t: t.growth_rate or 0, 
-            reverse=True
-        )
-        return sorted_trends[:limit] 
\ No newline at end of file
+        return heapq.nlargest(limit, self.trends, key=lambda t: t.growth_rate or 0) 
\ No newline at end of file
@@ -2,8 +2,9 @@
 Monitoring service for academic conferences and papers
 """
 from typing import Dict, List, Any, Optional, Callable
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
 import threading
-import time
 import logging
 from datetime import datetime
 
@@ -14,7 +15,7 @@ from conference_monitor.tools.conference_tools import ConferenceSearchTool, Conf
 from conference_monitor.tools.paper_tools import PaperSearchTool, PaperSummaryTool, RecentPapersMonitorTool
 from conference_monitor.tools.trending_tools import TrendingTopicsTool
 from conference_monitor.tools.storage_tools import ExportDataTool, ImportDataTool
-from conference_monitor.config import DEFAULT_RESEARCH_AREAS, DEFAULT_REFRESH_INTERVAL_DAYS
+from conference_monitor.config import DEFAULT_RESEARCH_AREAS, DEFAULT_REFRESH_INTERVAL_DAYS, MAX_REFRESH_WORKERS
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -41,16 +42,29 @@ class MonitorService:
         
         # Load research areas from metadata or use defaults
         metadata = self.memory.load_metadata()
-        self.research_areas = metadata.get("tracked_research_areas", DEFAULT_RESEARCH_AREAS)
+        # Insertion-ordered dict used as an ordered set of research areas
+        self._research_areas: Dict[str, None] = dict.fromkeys(
+            metadata.get("tracked_research_areas", DEFAULT_RESEARCH_AREAS)
+        )
         
         self.refresh_interval = refresh_interval
         self.monitoring_thread = None
         self.stop_event = threading.Event()
         
+        # Worker threads for per-area work, started on first use and kept
+        # warm across refreshes
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        
         # Initialize tools
         self._initialize_tools()
         
-        logger.info(f"Monitor service initialized with {len(self.research_areas)} research areas")
+        logger.info(f"Monitor service initialized with {len(self._research_areas)} research areas")
+    
+    @property
+    def research_areas(self) -> List[str]:
+        """Tracked research areas in the order they were added"""
+        return list(self._research_areas)
     
     def _initialize_tools(self):
         """Initialize monitoring tools"""
@@ -99,13 +113,13 @@ class MonitorService:
         Args:
             research_areas: List of research areas to track
         """
-        self.research_areas = research_areas
+        self._research_areas = dict.fromkeys(research_areas)
         
         # Update metadata
-        metadata = self.memory.load_metadata()
-        metadata["tracked_research_areas"] = research_areas
-        metadata["last_updated"] = datetime.now().isoformat()
-        self.memory.save_metadata(metadata)
+        self.memory.update_metadata(
+            tracked_research_areas=self.research_areas,
+            last_updated=datetime.now().isoformat()
+        )
         
         logger.info(f"Updated research areas: {', '.join(research_areas)}")
     
@@ -115,14 +129,14 @@ class MonitorService:
         Args:
             research_area: Research area to add
         """
-        if research_area not in self.research_areas:
-            self.research_areas.append(research_area)
+        if research_area not in self._research_areas:
+            self._research_areas[research_area] = None
             
             # Update metadata
-            metadata = self.memory.load_metadata()
-            metadata["tracked_research_areas"] = self.research_areas
-            metadata["last_updated"] = datetime.now().isoformat()
-            self.memory.save_metadata(metadata)
+            self.memory.update_metadata(
+                tracked_research_areas=self.research_areas,
+                last_updated=datetime.now().isoformat()
+            )
             
             logger.info(f"Added research area: {research_area}")
     
@@ -132,14 +146,14 @@ class MonitorService:
         Args:
             research_area: Research area to remove
         """
-        if research_area in self.research_areas:
-            self.research_areas.remove(research_area)
+        if research_area in self._research_areas:
+            del self._research_areas[research_area]
             
             # Update metadata
-            metadata = self.memory.load_metadata()
-            metadata["tracked_research_areas"] = self.research_areas
-            metadata["last_updated"] = datetime.now().isoformat()
-            self.memory.save_metadata(metadata)
+            self.memory.update_metadata(
+                tracked_research_areas=self.research_areas,
+                last_updated=datetime.now().isoformat()
+            )
             
             logger.info(f"Removed research area: {research_area}")
     
@@ -161,21 +175,22 @@ class MonitorService:
                 "timestamp": datetime.now().isoformat()
             }
         
+        # One timestamp for every conference saved by this refresh
+        refresh_time = datetime.now()
+        
         results = {
             "areas": research_areas,
-            "start_time": datetime.now().isoformat(),
+            "start_time": refresh_time.isoformat(),
             "conferences": [],
             "total_conferences": 0
         }
         
-        # Use tools to search for conferences
+        # Use tools to search for conferences, all areas at once since each
+        # search mostly waits on the network
         all_conferences = []
+        area_conferences = self._map_areas(self._search_conferences, research_areas)
         
-        for area in research_areas:
-            # Search for conferences in this area
-            logger.info(f"Searching for conferences in area: {area}")
-            conferences = self.conference_search.execute(query=area)
-            
+        for area, conferences in zip(research_areas, area_conferences):
             # Add some sample conferences if none found (for testing)
             if not conferences:
                 logger.info(f"No conferences found, adding sample conferences for {area}")
@@ -183,17 +198,16 @@ class MonitorService:
                 conferences = sample_conferences
             
             if conferences:
-                # Process and save conferences
-                for conf in conferences:
-                    # Add to memory
-                    self.memory.save_conference(conf)
-                
                 # Add to results
                 all_conferences.extend(conferences)
                 logger.info(f"Found {len(conferences)} conferences for {area}")
             else:
                 logger.info(f"Found 0 conferences for {area}")
         
+        # Save every area's conferences to memory in one transaction
+        if all_conferences:
+            self.memory.save_conferences_bulk(all_conferences, now=refresh_time)
+        
         # Update results
         results["conferences"] = all_conferences
         results["total_conferences"] = len(all_conferences)
@@ -201,6 +215,53 @@ class MonitorService:
         
         return results
     
+    def _map_areas(self, func: Callable[[str], Any], research_areas: List[str]) -> List[Any]:
+        """Run a function for each research area concurrently
+        
+        Args:
+            func: Function taking a research area
+            research_areas: Non-empty list of research areas
+            
+        Returns:
+            Results in the order of research_areas
+        """
+        return list(self._get_executor().map(func, research_areas))
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the worker thread pool used for per-area work, starting it on first use
+        
+        Returns:
+            Thread pool executor
+        """
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=MAX_REFRESH_WORKERS,
+                                                    thread_name_prefix="monitor")
+            return self._executor
+    
+    def _search_conferences(self, area: str) -> List[Dict[str, Any]]:
+        """Search for conferences in a research area
+        
+        Args:
+            area: Research area to search
+            
+        Returns:
+            List of conferences found
+        """
+        logger.info(f"Searching for conferences in area: {area}")
+        return self.conference_search.execute(query=area)
+    
+    def _search_papers(self, area: str) -> List[Dict[str, Any]]:
+        """Search for papers in a research area
+        
+        Args:
+            area: Research area to search
+            
+        Returns:
+            List of papers found, not yet saved so their stored analyses can be reused
+        """
+        return self.paper_search.execute(query=area, save=False).get("papers", [])
+    
     def _generate_sample_conferences(self, research_area: str) -> List[Dict[str, Any]]:
         """Generate sample conferences for testing
         
@@ -380,39 +441,39 @@ class MonitorService:
                 "timestamp": datetime.now().isoformat()
             }
         
+        # One timestamp for every paper saved by this refresh
+        refresh_time = datetime.now()
+        
         results = {
             "areas": research_areas,
-            "start_time": datetime.now().isoformat(),
+            "start_time": refresh_time.isoformat(),
             "papers": [],
             "total_papers": 0
         }
         
-        # Use tools to search for papers
+        # Use tools to search for papers in all areas at once; the analysis
+        # below already sends concurrent LLM requests, so areas take turns there
         all_papers = []
+        area_papers = self._map_areas(self._search_papers, research_areas)
         
-        for area in research_areas:
-            # Search for papers in this area
-            papers = self.paper_search.execute(query=area)
-            
+        for area, papers in zip(research_areas, area_papers):
             if papers:
-                # Process papers with the agent
-                processed_papers = []
-                for paper in papers:
-                    # Add analysis
-                    try:
-                        analysis = self.agent.analyze_paper(paper)
-                        if analysis:
-                            paper["analysis"] = analysis
-                    except Exception as e:
-                        logger.error(f"Error analyzing paper: {str(e)}")
-                    
-                    # Save to memory
-                    self.memory.save_paper(paper)
-                    processed_papers.append(paper)
+                # Reuse stored analyses, then analyze the remaining papers with concurrent LLM requests
+                pending = self._attach_stored_analyses(papers)
+                analyses = self.agent.run_async(self.agent.analyze_papers_batch(pending)) if pending else []
+                
+                # Failed analyses are left off, so the next refresh retries them
+                for paper, analysis in zip(pending, analyses):
+                    if analysis and "error" not in analysis:
+                        paper["analysis"] = analysis
+                        paper.setdefault("metadata", {})["analysis_hash"] = self._paper_content_hash(paper)
+                
+                # Save to memory
+                self.memory.save_papers_bulk(papers, now=refresh_time)
                 
                 # Add to results
-                all_papers.extend(processed_papers)
-                logger.info(f"Found {len(processed_papers)} papers for {area}")
+                all_papers.extend(papers)
+                logger.info(f"Found {len(papers)} papers for {area}")
             else:
                 logger.info(f"Found 0 papers for {area}")
         
@@ -423,6 +484,45 @@ class MonitorService:
         
         return results
     
+    @staticmethod
+    def _paper_content_hash(paper: Dict[str, Any]) -> str:
+        """Hash the content a paper's analysis is based on
+        
+        Args:
+            paper: Paper data dictionary
+            
+        Returns:
+            Hex digest of the paper's title and abstract
+        """
+        content = f"{paper.get('title', '')}\n{paper.get('abstract', '')}"
+        return hashlib.blake2b(content.encode('utf-8'), digest_size=16).hexdigest()
+    
+    def _attach_stored_analyses(self, papers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Copy stored analyses onto papers whose title and abstract are unchanged
+        
+        The hash of the analyzed content is kept in the paper's metadata.
+        
+        Args:
+            papers: List of paper data dictionaries
+            
+        Returns:
+            Papers that still need to be analyzed
+        """
+        pending = []
+        for paper in papers:
+            content_hash = self._paper_content_hash(paper)
+            stored = self.memory.get_paper(paper["id"]) if "id" in paper else None
+            
+            stored_hash = (stored.get("metadata") or {}).get("analysis_hash") if stored else None
+            
+            if stored_hash == content_hash and stored.get("analysis"):
+                paper["analysis"] = stored["analysis"]
+                paper.setdefault("metadata", {})["analysis_hash"] = content_hash
+            else:
+                pending.append(paper)
+        
+        return pending
+    
     def get_upcoming_deadlines(self, days_ahead: int = 30) -> Dict[str, Any]:
         """Get upcoming conference deadlines
         
@@ -462,8 +562,7 @@ class MonitorService:
             "total_trends": 0
         }
         
-        # Analyze trends for each research area
-        for area in research_areas:
+        def analyze_area(area: str) -> Optional[List[Dict[str, Any]]]:
             try:
                 area_results = self.trending_topics.execute(
                     research_area=area,
@@ -471,11 +570,17 @@ class MonitorService:
                 )
                 
                 trends = area_results.get("trends", [])
-                results["trends"][area] = trends
-                
-                logger.info(f"Found {len(trends)} trends for {area}")
             except Exception as e:
                 logger.error(f"Error analyzing trends for {area}: {str(e)}")
+                return None
+            
+            logger.info(f"Found {len(trends)} trends for {area}")
+            return trends
+        
+        # Analyze trends for all research areas concurrently
+        for area, trends in zip(research_areas, self._map_areas(analyze_area, research_areas)):
+            if trends is not None:
+                results["trends"][area] = trends
         
         # Count total trends
         results["total_trends"] = sum(len(trends) for trends in results["trends"].values())
@@ -530,20 +635,15 @@ class MonitorService:
                 
                 logger.info(f"Monitoring refresh completed: {total_conferences} conferences, {total_papers} papers")
                 
-                # Wait for the next refresh interval
+                # Wait for the next refresh interval, waking as soon as monitoring is stopped
                 # Convert days to seconds
                 interval_seconds = self.refresh_interval * 24 * 60 * 60
-                
-                # Check stop event every minute while waiting
-                for _ in range(interval_seconds // 60):
-                    if self.stop_event.is_set():
-                        break
-                    time.sleep(60)
+                self.stop_event.wait(interval_seconds)
                 
             except Exception as e:
                 logger.error(f"Error in monitoring loop: {str(e)}")
                 # Wait for a shorter time after an error
-                time.sleep(60 * 30)  # 30 minutes
+                self.stop_event.wait(60 * 30)  # 30 minutes
         
         logger.info("Monitoring thread stopped")
     
@@ -551,7 +651,18 @@ class MonitorService:
         """Stop the monitoring thread"""
         if self.monitoring_thread and self.monitoring_thread.is_alive():
             self.stop_event.set()
-            self.monitoring_thread.join(timeout=1.0)
+            
+            # Waits are interrupted by the event, so this only waits for a refresh in progress
+            self.monitoring_thread.join()
             logger.info("Monitoring thread stopped")
         else:
-            logger.warning("No monitoring thread running") 
\ No newline at end of file
+            logger.warning("No monitoring thread running")
+    
+    def close(self):
+        """Stop monitoring and release the worker threads"""
+        if self.monitoring_thread and self.monitoring_thread.is_alive():
+            self.stop_monitoring()
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(cancel_futures=True)
+                self._executor = None 
\ No newline at end of file
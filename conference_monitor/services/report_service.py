@@ -6,10 +6,10 @@ import logging
 from datetime import datetime
 import uuid
 import os
-import json
+import orjson
 
 from conference_monitor.core.agent import ConferenceAgent
-from conference_monitor.core.memory import AgentMemory
+from conference_monitor.core.memory import AgentMemory, JSON_FILE_OPTIONS
 from conference_monitor.config import DATA_DIR
 
 # Set up logging
@@ -50,7 +50,7 @@ class ReportService:
             Dictionary with report data
         """
         # Get conferences from memory
-        conferences = self.memory.list_conferences()
+        conferences = self.memory.load_conferences()
         
         # Filter by research area if provided
         if research_area:
@@ -102,8 +102,8 @@ class ReportService:
         
         # Save report
         report_path = os.path.join(self.reports_dir, f"{report_id}.json")
-        with open(report_path, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        with open(report_path, 'wb') as f:
+            f.write(orjson.dumps(report, option=JSON_FILE_OPTIONS))
         
         return report
     
@@ -120,7 +120,7 @@ class ReportService:
             Dictionary with report data
         """
         # Get papers from memory
-        papers = self.memory.list_papers()
+        papers = self.memory.load_papers()
         
         # Filter to match research area
         filtered_papers = []
@@ -196,8 +196,8 @@ class ReportService:
         
         # Save report
         report_path = os.path.join(self.reports_dir, f"{report_id}.json")
-        with open(report_path, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        with open(report_path, 'wb') as f:
+            f.write(orjson.dumps(report, option=JSON_FILE_OPTIONS))
         
         return report
     
@@ -305,8 +305,8 @@ class ReportService:
         
         # Save report
         report_path = os.path.join(self.reports_dir, f"{report_id}.json")
-        with open(report_path, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        with open(report_path, 'wb') as f:
+            f.write(orjson.dumps(report, option=JSON_FILE_OPTIONS))
         
         return report
     
@@ -328,8 +328,8 @@ class ReportService:
             file_path = os.path.join(self.reports_dir, file_name)
             
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    report = json.load(f)
+                with open(file_path, 'rb') as f:
+                    report = orjson.loads(f.read())
                 
                 reports.append({
                     "id": report.get('id', ''),
@@ -363,8 +363,8 @@ class ReportService:
             return None
         
         try:
-            with open(report_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(report_path, 'rb') as f:
+                return orjson.loads(f.read())
         except Exception as e:
             logger.error(f"Error loading report {report_id}: {str(e)}")
             return None 
\ No newline at end of file
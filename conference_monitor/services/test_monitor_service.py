@@ -0,0 +1,69 @@
+"""
+Tests for the monitor service refresh pipeline
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from conference_monitor.core.memory import AgentMemory
+from conference_monitor.services.monitor_service import MonitorService
+from conference_monitor.tools import paper_tools
+
+
+def scholar_results(query):
+    """Google Scholar results as scholarly.search_pubs yields them"""
+    return iter([
+        {"pub_url": "https://example.org/1", "num_citations": 3,
+         "bib": {"title": "Sparse attention", "abstract": "We make attention sparse."}},
+        {"pub_url": "https://example.org/2", "num_citations": 1,
+         "bib": {"title": "Faster decoding", "abstract": "We decode faster."}}
+    ])
+
+
+class FakeAgent:
+    """Agent recording which papers it was asked to analyze"""
+    
+    def __init__(self):
+        self.analyzed = []
+    
+    async def analyze_papers_batch(self, papers):
+        self.analyzed.extend(paper["id"] for paper in papers)
+        return [
+            {"paper_id": paper["id"], "title": paper["title"], "analysis": f"Analysis of {paper['title']}"}
+            for paper in papers
+        ]
+    
+    def run_async(self, coroutine):
+        return asyncio.run(coroutine)
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    """Monitor service backed by a temporary memory, with Google Scholar and the LLM stubbed"""
+    monkeypatch.setattr(paper_tools.scholarly, "search_pubs", scholar_results)
+    monitor = MonitorService(agent=FakeAgent(), memory=AgentMemory(data_dir=str(tmp_path)), browser=SimpleNamespace())
+    yield monitor
+    monitor.close()
+
+
+def test_refresh_papers_analyzes_and_saves_search_results(service):
+    """Papers from the search tool's result are analyzed and stored"""
+    results = service.refresh_papers(["machine learning"])
+    
+    assert results["total_papers"] == 2
+    assert service.agent.analyzed == ["https://example.org/1", "https://example.org/2"]
+    
+    stored = service.memory.get_paper("https://example.org/1")
+    assert stored["analysis"]["analysis"] == "Analysis of Sparse attention"
+
+
+def test_refresh_papers_reuses_analyses_of_unchanged_papers(service):
+    """A second refresh of the same papers makes no LLM call"""
+    service.refresh_papers(["machine learning"])
+    service.agent.analyzed.clear()
+    
+    results = service.refresh_papers(["machine learning"])
+    
+    assert service.agent.analyzed == []
+    assert all(paper["analysis"] for paper in results["papers"])
@@ -102,17 +102,16 @@ class ConferenceSearchTool(BaseTool):
         conferences = []
         errors = []
         
-        for source in sources:
+        # Fetch all source pages concurrently
+        search_urls = [self._build_search_url(source, research_area, keywords) for source in sources]
+        pages = self.browser.get_pages(search_urls)
+        page_infos = self.browser.find_conference_infos(pages)
+        
+        for source, html_content, page_info in zip(sources, pages, page_infos):
             try:
-                # Construct search URL based on the source
-                search_url = self._build_search_url(source, research_area, keywords)
-                
-                # Fetch the page
-                html_content = self.browser.get_page(search_url)
-                
                 if html_content:
                     # Extract conferences from the HTML
-                    source_conferences = self._extract_conferences(html_content, source, research_area)
+                    source_conferences = self._extract_conferences(html_content, source, research_area, page_info)
                     
                     # Add source to each conference
                     for conf in source_conferences:
@@ -123,9 +122,9 @@ class ConferenceSearchTool(BaseTool):
                         if "id" not in conf:
                             title_slug = re.sub(r'[^a-z0-9]', '_', conf.get('title', '').lower())
                             conf["id"] = f"conf_{title_slug[:30]}_{hash(conf.get('url', ''))}"
-                        
-                        # Save to memory
-                        self.memory.save_conference(conf)
+                    
+                    # Save to memory
+                    self.memory.save_conferences_bulk(source_conferences)
                     
                     conferences.extend(source_conferences)
                 else:
@@ -229,13 +228,15 @@ class ConferenceSearchTool(BaseTool):
         result = self._execute(research_area=query)
         return result.get("conferences", [])
     
-    def _extract_conferences(self, html: str, source: str, query: str) -> List[Dict[str, Any]]:
+    def _extract_conferences(self, html: str, source: str, query: str,
+                             conference_data: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """Extract conference information from HTML
         
         Args:
             html: HTML content
             source: Source URL
             query: The original search query
+            conference_data: Conference information already extracted from the HTML, if any
             
         Returns:
             List of conference dictionaries
@@ -243,7 +244,8 @@ class ConferenceSearchTool(BaseTool):
         conferences = []
         
         # Extract using natural language processing
-        conference_data = self.browser.find_conference_info(html)
+        if conference_data is None:
+            conference_data = self.browser.find_conference_info(html)
         
         if conference_data and 'title' in conference_data and conference_data['title']:
             # Clean up the data and add ID
@@ -261,13 +263,13 @@ class ConferenceSearchTool(BaseTool):
             ]
             
             # Get the first 3 links to avoid too many requests
-            for link in conference_links[:3]:
+            conference_links = conference_links[:3]
+            conf_pages = self.browser.get_pages([link['url'] for link in conference_links])
+            conf_infos = self.browser.find_conference_infos(conf_pages)
+            
+            for link, conf_html, conf_info in zip(conference_links, conf_pages, conf_infos):
                 try:
-                    # Fetch the conference page
-                    conf_html = self.browser.get_page(link['url'])
                     if conf_html:
-                        conf_info = self.browser.find_conference_info(conf_html)
-                        
                         # Use link text as title if no title found
                         if not conf_info.get('title'):
                             conf_info['title'] = link['text']
@@ -449,22 +451,19 @@ class ConferenceDeadlineTool(BaseTool):
         Returns:
             Dictionary with upcoming deadlines
         """
-        conferences = self.memory.list_conferences()
+        # Stream conferences from memory rather than loading them all at once
+        conferences = self.memory.iter_conferences()
         
         # Filter by research area if provided
         if research_area:
             research_area_lower = research_area.lower()
-            filtered_conferences = []
-            for conf in conferences:
-                # Check title and description for the research area
-                title = conf.get('title', '').lower()
-                desc = conf.get('description', '').lower()
-                
-                if (research_area_lower in title or 
-                    research_area_lower in desc):
-                    filtered_conferences.append(conf)
             
-            conferences = filtered_conferences
+            # Check title and description for the research area
+            conferences = (
+                conf for conf in conferences
+                if research_area_lower in conf.get('title', '').lower()
+                or research_area_lower in conf.get('description', '').lower()
+            )
         
         # Extract deadlines
         deadlines = []
@@ -4,9 +4,6 @@ Paper search tools for finding and analyzing academic papers
 from typing import Dict, List, Any, Optional
 import logging
 from datetime import datetime, timedelta
-import os
-import json
-import re
 import uuid
 
 from scholarly import scholarly
@@ -14,7 +11,7 @@ import requests
 
 from conference_monitor.tools.base import BaseTool
 from conference_monitor.core.memory import AgentMemory
-from conference_monitor.config import SEMANTIC_SCHOLAR_API_KEY, MAX_PAPERS_PER_QUERY, DATA_DIR
+from conference_monitor.config import SEMANTIC_SCHOLAR_API_KEY, MAX_PAPERS_PER_QUERY
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -84,12 +81,14 @@ class PaperSearchTool(BaseTool):
         # Just delegate to the execute method
         return self.execute(query=query, limit=limit or MAX_PAPERS_PER_QUERY)
     
-    def execute(self, query: str, limit: int = MAX_PAPERS_PER_QUERY) -> Dict[str, Any]:
+    def execute(self, query: str, limit: int = MAX_PAPERS_PER_QUERY, save: bool = True) -> Dict[str, Any]:
         """Execute the paper search tool
         
         Args:
             query: Search query
             limit: Maximum number of papers to return
+            save: Whether to save the papers found to memory; callers that
+                save them themselves pass False so stored analyses survive
             
         Returns:
             Dictionary with search results
@@ -126,15 +125,13 @@ class PaperSearchTool(BaseTool):
                     "research_area": query
                 }
                 
-                # Save paper to disk using our safe method
-                self._save_paper(paper)
-                
-                # Add to memory
-                self.memory.save_paper(paper)
-                
                 # Add to results
                 papers.append(paper)
             
+            # Add to memory
+            if save:
+                self.memory.save_papers_bulk(papers)
+            
             results["papers"] = papers
             results["total"] = len(papers)
             
@@ -148,35 +145,6 @@ class PaperSearchTool(BaseTool):
                 "error": str(e)
             }
 
-    def _save_paper(self, paper: Dict[str, Any]) -> str:
-        """Save paper data to disk
-        
-        Args:
-            paper: Paper data
-            
-        Returns:
-            Path to saved file
-        """
-        try:
-            # Generate a safe filename - replace any URL or special chars
-            paper_id = paper.get("id", str(uuid.uuid4()))
-            # Remove any URL components or invalid filename characters
-            safe_id = re.sub(r'[\\/:*?"<>|]', '_', paper_id)
-            
-            # Ensure directory exists
-            os.makedirs(os.path.join(DATA_DIR, "papers"), exist_ok=True)
-            
-            # Save to file
-            filename = os.path.join(DATA_DIR, "papers", f"{safe_id}.json")
-            
-            with open(filename, "w", encoding="utf-8") as f:
-                json.dump(paper, f, indent=2)
-            
-            return filename
-        except Exception as e:
-            logger.error(f"Error saving paper: {str(e)}")
-            return ""
-
 
 class PaperSummaryTool(BaseTool):
     """Tool for summarizing academic papers"""
@@ -3,13 +3,13 @@ Storage tools for managing agent data
 """
 from typing import Dict, List, Any, Optional
 import logging
-import json
+import orjson
 from pathlib import Path
 import os
 from datetime import datetime
 
 from conference_monitor.tools.base import BaseTool
-from conference_monitor.core.memory import AgentMemory
+from conference_monitor.core.memory import AgentMemory, JSON_FILE_OPTIONS
 from conference_monitor.config import DATA_DIR
 
 # Set up logging
@@ -41,7 +41,7 @@ class ExportDataTool(BaseTool):
                 },
                 "format": {
                     "type": "string",
-                    "description": "Format to export data in (json, csv)"
+                    "description": "Format to export data in (json, or files for one JSON file per record)"
                 },
                 "file_path": {
                     "type": "string",
@@ -63,9 +63,12 @@ class ExportDataTool(BaseTool):
         Returns:
             Dictionary with export results
         """
+        if format == "files":
+            return self._export_files(data_type)
+        
         if format != "json":
             return {
-                "error": f"Unsupported export format: {format}. Only 'json' is currently supported."
+                "error": f"Unsupported export format: {format}. Supported formats are: json, files"
             }
         
         # Determine data to export
@@ -95,8 +98,8 @@ class ExportDataTool(BaseTool):
         
         # Export data
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
+            with open(file_path, 'wb') as f:
+                f.write(orjson.dumps(export_data, option=JSON_FILE_OPTIONS))
             
             return {
                 "success": True,
@@ -110,6 +113,36 @@ class ExportDataTool(BaseTool):
                 "error": f"Error exporting data: {str(e)}",
                 "data_type": data_type
             }
+    
+    def _export_files(self, data_type: str) -> Dict[str, Any]:
+        """Export every record to its own JSON file under the data directory
+        
+        Args:
+            data_type: Type of data to export; only "all" is supported
+            
+        Returns:
+            Dictionary with export results
+        """
+        if data_type != "all":
+            return {
+                "error": f"The 'files' format exports all data. Use data type 'all' instead of: {data_type}"
+            }
+        
+        try:
+            record_count = self.memory.export_to_files()
+            
+            return {
+                "success": True,
+                "file_path": str(self.memory.data_dir),
+                "data_type": data_type,
+                "record_count": record_count
+            }
+        except Exception as e:
+            logger.error(f"Error exporting data to files: {str(e)}")
+            return {
+                "error": f"Error exporting data to files: {str(e)}",
+                "data_type": data_type
+            }
 
 
 class ImportDataTool(BaseTool):
@@ -172,8 +205,8 @@ class ImportDataTool(BaseTool):
         
         # Import data
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                import_data = json.load(f)
+            with open(file_path, 'rb') as f:
+                import_data = orjson.loads(f.read())
             
             import_stats = {
                 "conferences": 0,
@@ -183,19 +216,14 @@ class ImportDataTool(BaseTool):
             
             # Import conferences
             if "all" in data_types or "conferences" in data_types:
-                conferences = import_data.get("conferences", [])
-                for conf in conferences:
-                    if "id" in conf:
-                        self.memory.save_conference(conf)
-                        import_stats["conferences"] += 1
+                conferences = [conf for conf in import_data.get("conferences", []) if "id" in conf]
+                import_stats["conferences"] += self.memory.save_conferences_bulk(conferences)
             
             # Import papers
             if "all" in data_types or "papers" in data_types:
-                papers = import_data.get("papers", [])
-                for paper in papers:
-                    if "id" in paper:
-                        self.memory.save_paper(paper)
-                        import_stats["papers"] += 1
+                papers = [paper for paper in import_data.get("papers", []) if "id" in paper]
+                self.memory.save_papers_bulk(papers)
+                import_stats["papers"] += len(papers)
             
             # Import trends
             if "all" in data_types or "trends" in data_types:
@@ -189,8 +189,7 @@ class ConferenceTopicsTool(BaseTool):
         
         if not conference_data and conference_name:
             # Try to find conference by name in memory
-            conferences = self.memory.list_conferences()
-            for conf in conferences:
+            for conf in self.memory.iter_conferences():
                 if conference_name.lower() in conf.get('title', '').lower():
                     conference_data = conf
                     break
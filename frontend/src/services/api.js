@@ -10,6 +10,25 @@ const apiClient = axios.create({
   },
 });
 
+const JOB_POLL_INTERVAL_MS = 2000;
+
+// Poll a background job until it finishes and return its result
+const waitForJob = async (jobId) => {
+  for (;;) {
+    const response = await apiClient.get(`/api/jobs/${jobId}`);
+    const job = response.data;
+    
+    if (job.state === 'done') {
+      return job.result;
+    }
+    if (job.state === 'failed') {
+      throw new Error(job.message);
+    }
+    
+    await new Promise((resolve) => setTimeout(resolve, JOB_POLL_INTERVAL_MS));
+  }
+};
+
 // API functions
 export const ApiService = {
   // Status endpoint
@@ -51,7 +70,7 @@ export const ApiService = {
   refreshConferences: async (researchAreas) => {
     try {
       const response = await apiClient.post('/api/conferences/refresh', { research_areas: researchAreas });
-      return response.data;
+      return await waitForJob(response.data.job_id);
     } catch (error) {
       console.error('Error refreshing conferences:', error);
       throw error;
@@ -73,7 +92,7 @@ export const ApiService = {
   refreshPapers: async (researchAreas) => {
     try {
       const response = await apiClient.post('/api/papers/refresh', { research_areas: researchAreas });
-      return response.data;
+      return await waitForJob(response.data.job_id);
     } catch (error) {
       console.error('Error refreshing papers:', error);
       throw error;